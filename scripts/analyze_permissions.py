@@ -1,17 +1,35 @@
 #!/usr/bin/env python3
 """Analyze GoodData users, groups, and permissions."""
 
-import json
+import argparse
+import functools
+import heapq
+import itertools
 import os
+import pickle
 import sys
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from urllib.parse import urlparse
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+import orjson
 from dotenv import load_dotenv
 from gooddata_sdk import GoodDataSdk
+from gooddata_sdk.utils import load_all_entities
+from urllib3.util.retry import Retry
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument(
+    "--refresh",
+    action="store_true",
+    help="Ignore cached API responses and fetch everything again",
+)
+args = parser.parse_args()
 
 # Load environment
 env_path = Path(__file__).parent.parent / ".env"
@@ -26,14 +44,67 @@ if not host or not token:
 
 sdk = GoodDataSdk.create(host, token)
 
+# Permission fetches are independent HTTP round-trips, so issue them concurrently
+MAX_WORKERS = 32
+
+
+def size_connection_pool(sdk, maxsize):
+    """Grow the SDK's urllib3 pool so concurrent workers don't queue for sockets."""
+    try:
+        pool_manager = sdk.client._api_client.rest_client.pool_manager
+    except AttributeError:
+        return
+    # Pools are created lazily per host, so updating the kwargs is enough
+    pool_manager.connection_pool_kw["maxsize"] = maxsize
+    pool_manager.connection_pool_kw["retries"] = Retry(
+        total=3, backoff_factor=0.25, status_forcelist=[429, 502, 503, 504]
+    )
+
+
+size_connection_pool(sdk, MAX_WORKERS)
+
+# Raw section results are cached on disk so repeated runs skip the network
+CACHE_DIR = Path.home() / ".cache" / "gooddata-analyze" / (urlparse(host).netloc or host)
+CACHE_TTL = 3600  # seconds
+
+
+def cached(section, fetch):
+    """Return the cached result for a section, calling fetch() on miss or --refresh."""
+    path = CACHE_DIR / f"{section}.pkl"
+    if not args.refresh:
+        try:
+            if time.time() - path.stat().st_mtime < CACHE_TTL:
+                with open(path, "rb") as f:
+                    return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+    result = fetch()
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return result
+
+
+# The declarative documents carry users, groups, memberships and hierarchy,
+# so each is fetched once and shared by the sections below.
+@functools.lru_cache(maxsize=1)
+def declarative_users():
+    return cached("declarative_users", sdk.catalog_user.get_declarative_users)
+
+
+@functools.lru_cache(maxsize=1)
+def declarative_user_groups():
+    return cached("declarative_user_groups", sdk.catalog_user.get_declarative_user_groups)
+
+
 # Data structures to hold everything
 data = {
     "users": [],
     "groups": [],
     "workspaces": [],
-    "user_to_groups": defaultdict(list),
-    "group_to_users": defaultdict(list),
-    "group_hierarchy": defaultdict(list),  # parent -> children
+    "user_to_groups": {},
+    "group_to_users": {},
+    "group_hierarchy": {},  # parent -> children
     "workspace_permissions": defaultdict(list),
     "user_permissions": {},
     "group_permissions": {},
@@ -48,15 +119,19 @@ print("=" * 70)
 # ============================================================================
 print("\n[1/7] Fetching users...")
 try:
-    users = sdk.catalog_user.list_users()
-    for u in users:
-        user_data = {
+    # auth_id is a declared model field; firstname/lastname/email vary across
+    # SDK versions
+    users_append = data["users"].append
+    for u in declarative_users().users:
+        name = " ".join(
+            filter(None, (getattr(u, "firstname", None), getattr(u, "lastname", None)))
+        )
+        users_append({
             "id": u.id,
-            "name": getattr(u, "name", None),
+            "name": name or None,
             "email": getattr(u, "email", None),
-            "auth_id": getattr(u, "auth_id", None),
-        }
-        data["users"].append(user_data)
+            "auth_id": u.auth_id,
+        })
     print(f"      Found {len(data['users'])} users")
 except Exception as e:
     print(f"      Error: {e}")
@@ -66,13 +141,9 @@ except Exception as e:
 # ============================================================================
 print("\n[2/7] Fetching user groups...")
 try:
-    groups = sdk.catalog_user.list_user_groups()
-    for g in groups:
-        group_data = {
-            "id": g.id,
-            "name": getattr(g, "name", None),
-        }
-        data["groups"].append(group_data)
+    groups_append = data["groups"].append
+    for g in declarative_user_groups().user_groups:
+        groups_append({"id": g.id, "name": g.name})
     print(f"      Found {len(data['groups'])} groups")
 except Exception as e:
     print(f"      Error: {e}")
@@ -81,15 +152,22 @@ except Exception as e:
 # 3. FETCH USER-GROUP MEMBERSHIPS
 # ============================================================================
 print("\n[3/7] Fetching user-group memberships...")
+total_memberships = 0
 try:
-    decl_users = sdk.catalog_user.get_declarative_users()
-    for u in decl_users.users:
+    # Pre-seeded so empty groups still show up; setdefault covers references
+    # to groups missing from the declared list
+    decl_users = declarative_users().users
+    user_to_groups = data["user_to_groups"] = {u.id: [] for u in decl_users}
+    group_to_users = data["group_to_users"] = {
+        g.id: [] for g in declarative_user_groups().user_groups
+    }
+    for u in decl_users:
         if u.user_groups:
             for ug in u.user_groups:
-                data["user_to_groups"][u.id].append(ug.id)
-                data["group_to_users"][ug.id].append(u.id)
+                user_to_groups[u.id].append(ug.id)
+                group_to_users.setdefault(ug.id, []).append(u.id)
+                total_memberships += 1
 
-    total_memberships = sum(len(g) for g in data["user_to_groups"].values())
     print(f"      Found {total_memberships} user-group memberships")
 except Exception as e:
     print(f"      Error: {e}")
@@ -98,14 +176,16 @@ except Exception as e:
 # 4. FETCH GROUP HIERARCHY (parent-child relationships)
 # ============================================================================
 print("\n[4/7] Fetching group hierarchy...")
+hierarchies = 0
 try:
-    decl_groups = sdk.catalog_user.get_declarative_user_groups()
-    for g in decl_groups.user_groups:
+    decl_groups = declarative_user_groups().user_groups
+    group_hierarchy = data["group_hierarchy"] = {g.id: [] for g in decl_groups}
+    for g in decl_groups:
         if g.parents:
             for parent in g.parents:
-                data["group_hierarchy"][parent.id].append(g.id)
+                group_hierarchy.setdefault(parent.id, []).append(g.id)
+                hierarchies += 1
 
-    hierarchies = sum(len(c) for c in data["group_hierarchy"].values())
     print(f"      Found {hierarchies} parent-child group relationships")
 except Exception as e:
     print(f"      Error: {e}")
@@ -115,14 +195,10 @@ except Exception as e:
 # ============================================================================
 print("\n[5/7] Fetching workspaces...")
 try:
-    workspaces = sdk.catalog_workspace.list_workspaces()
-    for ws in workspaces:
-        ws_data = {
-            "id": ws.id,
-            "name": ws.name,
-            "parent_id": getattr(ws, "parent_id", None),
-        }
-        data["workspaces"].append(ws_data)
+    data["workspaces"] = cached("workspaces", lambda: [
+        {"id": ws.id, "name": ws.name, "parent_id": ws.parent_id}
+        for ws in sdk.catalog_workspace.list_workspaces()
+    ])
     print(f"      Found {len(data['workspaces'])} workspaces")
 except Exception as e:
     print(f"      Error: {e}")
@@ -131,25 +207,82 @@ except Exception as e:
 # 6. FETCH WORKSPACE PERMISSIONS
 # ============================================================================
 print("\n[6/7] Fetching workspace permissions...")
+
+# Groups referenced by any workspace permission (used by Anomaly Check 4)
+used_groups = set()
+total_perms = 0
+
+
+def fetch_ws_perms(ws_id):
+    """Fetch permission entries for a single workspace."""
+    perms = sdk.catalog_permission.get_declarative_permissions(ws_id)
+    entries = []
+    if perms.permissions:
+        for p in perms.permissions:
+            entries.append({
+                "workspace_id": ws_id,
+                "assignee_id": p.assignee.id if p.assignee else None,
+                "assignee_type": p.assignee.type if p.assignee else None,
+                "name": p.name,
+            })
+    return ws_id, entries
+
+
+def manageable_workspace_ids():
+    """IDs of workspaces whose permissions the token may read, or None if unknown."""
+    try:
+        entities = load_all_entities(
+            functools.partial(
+                sdk.client.entities_api.get_all_entities_workspaces,
+                meta_include=["permissions"],
+                _check_return_type=False,
+            )
+        )
+    except Exception:
+        return None
+
+    manageable = set()
+    any_permissions = False
+    for e in entities.data:
+        permissions = (e.get("meta") or {}).get("permissions")
+        if permissions is None:
+            continue
+        any_permissions = True
+        if "MANAGE" in permissions:
+            manageable.add(e["id"])
+    # The server may ignore meta_include; without permissions we can't filter
+    return manageable if any_permissions else None
+
+
+def fetch_all_ws_perms():
+    """Fetch permissions for every readable workspace as (ws_id, entries) pairs."""
+    # Preflight: skip workspaces that would only answer with an authorization error
+    readable = manageable_workspace_ids()
+    ws_ids = [ws["id"] for ws in data["workspaces"] if readable is None or ws["id"] in readable]
+    if readable is not None:
+        print(f"      Skipping {len(data['workspaces']) - len(ws_ids)} workspaces without MANAGE")
+
+    results = []
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(fetch_ws_perms, ws_id) for ws_id in ws_ids]
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception:
+                # May not have permission to view this workspace's permissions
+                continue
+    return results
+
+
 try:
-    for ws in data["workspaces"]:
-        ws_id = ws["id"]
-        try:
-            perms = sdk.catalog_permission.get_declarative_permissions(ws_id)
-            if perms.permissions:
-                for p in perms.permissions:
-                    perm_entry = {
-                        "workspace_id": ws_id,
-                        "assignee_id": p.assignee.id if p.assignee else None,
-                        "assignee_type": p.assignee.type if p.assignee else None,
-                        "name": p.name,
-                    }
-                    data["workspace_permissions"][ws_id].append(perm_entry)
-        except Exception as e:
-            # May not have permission to view this workspace's permissions
-            pass
+    for ws_id, entries in cached("workspace_permissions", fetch_all_ws_perms):
+        if entries:
+            data["workspace_permissions"][ws_id].extend(entries)
+            total_perms += len(entries)
+            for entry in entries:
+                if entry["assignee_type"] == "userGroup":
+                    used_groups.add(entry["assignee_id"])
 
-    total_perms = sum(len(p) for p in data["workspace_permissions"].values())
     print(f"      Found {total_perms} workspace permission assignments")
 except Exception as e:
     print(f"      Error: {e}")
@@ -158,33 +291,69 @@ except Exception as e:
 # 7. FETCH INDIVIDUAL USER/GROUP PERMISSIONS
 # ============================================================================
 print("\n[7/7] Fetching individual user and group permissions...")
-try:
-    for user in data["users"]:
-        try:
-            perms = sdk.catalog_user.get_user_permissions(user["id"])
-            data["user_permissions"][user["id"]] = [
-                {"workspace_id": p.workspace_id, "permission": p.name}
-                for p in perms
-            ] if perms else []
-        except:
-            pass
 
-    for group in data["groups"]:
-        try:
-            perms = sdk.catalog_user.get_user_group_permissions(group["id"])
-            data["group_permissions"][group["id"]] = [
-                {"workspace_id": p.workspace_id, "permission": p.name}
-                for p in perms
-            ] if perms else []
-        except:
-            pass
 
-    user_perms_count = sum(len(p) for p in data["user_permissions"].values())
-    group_perms_count = sum(len(p) for p in data["group_permissions"].values())
+def fetch_principal_perms(kind, ident):
+    """Fetch permissions for a user or user group; None if not accessible."""
+    try:
+        if kind == "user":
+            perms = sdk.catalog_user.get_user_permissions(ident)
+        else:
+            perms = sdk.catalog_user.get_user_group_permissions(ident)
+    except Exception:
+        return kind, ident, None
+    # (workspace_id, permission) tuples; expanded to dicts only when saving
+    return kind, ident, [(p.workspace_id, p.name) for p in perms] if perms else []
+
+
+def fetch_all_principal_perms():
+    """Fetch permissions for principals not covered by section 6 as (kind, id, perms) triples."""
+    jobs = [("user", u["id"]) for u in data["users"] if u["id"] not in data["user_permissions"]]
+    jobs += [("group", g["id"]) for g in data["groups"] if g["id"] not in data["group_permissions"]]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return list(executor.map(lambda job: fetch_principal_perms(*job), jobs))
+
+
+user_perms_count = 0
+group_perms_count = 0
+try:
+    # Invert the workspace permissions from section 6 instead of asking per principal
+    for ws_id, perms in data["workspace_permissions"].items():
+        for p in perms:
+            if p["assignee_type"] == "user":
+                data["user_permissions"].setdefault(p["assignee_id"], []).append((ws_id, p["name"]))
+                user_perms_count += 1
+            elif p["assignee_type"] == "userGroup":
+                data["group_permissions"].setdefault(p["assignee_id"], []).append((ws_id, p["name"]))
+                group_perms_count += 1
+
+    for kind, ident, perms in cached("principal_permissions", fetch_all_principal_perms):
+        if perms is None:
+            continue
+        if kind == "user":
+            data["user_permissions"][ident] = perms
+            user_perms_count += len(perms)
+        else:
+            data["group_permissions"][ident] = perms
+            group_perms_count += len(perms)
+
     print(f"      Found {user_perms_count} user permissions, {group_perms_count} group permissions")
 except Exception as e:
     print(f"      Error: {e}")
 
+# Build phase is over: freeze into plain dicts holding only non-empty entries,
+# so reads below can never auto-vivify and key presence means "has items"
+for key in ("user_to_groups", "group_to_users", "group_hierarchy", "workspace_permissions"):
+    data[key] = {k: v for k, v in data[key].items() if v}
+
+
+
+def emit(lines):
+    """Write a block of lines to stdout in a single call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
 # ============================================================================
 # OUTPUT RAW DATA
 # ============================================================================
@@ -193,23 +362,29 @@ print("RAW DATA SUMMARY")
 print("=" * 70)
 
 print("\n### USERS ###")
+lines = []
 for u in data["users"]:
     groups = data["user_to_groups"].get(u["id"], [])
     name = u.get('name') or 'N/A'
-    print(f"  {u['id']:<30} | {name:<25} | Groups: {groups}")
+    lines.append(f"  {u['id']:<30} | {name:<25} | Groups: {groups}")
+emit(lines)
 
 print("\n### GROUPS ###")
+lines = []
 for g in data["groups"]:
     members = data["group_to_users"].get(g["id"], [])
     children = data["group_hierarchy"].get(g["id"], [])
     name = g.get('name') or 'N/A'
-    print(f"  {g['id']:<30} | {name:<25} | Members: {len(members)}, Children: {children}")
+    lines.append(f"  {g['id']:<30} | {name:<25} | Members: {len(members)}, Children: {children}")
+emit(lines)
 
 print("\n### WORKSPACES ###")
+lines = []
 for ws in data["workspaces"]:
     perms = data["workspace_permissions"].get(ws["id"], [])
     name = ws.get('name') or 'N/A'
-    print(f"  {ws['id']:<30} | {name:<30} | Permissions: {len(perms)}")
+    lines.append(f"  {ws['id']:<30} | {name:<30} | Permissions: {len(perms)}")
+emit(lines)
 
 # ============================================================================
 # PATTERN ANALYSIS
@@ -219,27 +394,26 @@ print("PATTERN ANALYSIS")
 print("=" * 70)
 
 # Pattern 1: Users with no group memberships
-users_no_groups = [u["id"] for u in data["users"] if not data["user_to_groups"].get(u["id"])]
+# Membership keys only exist once a member was appended, so presence == non-empty
+users_no_groups = [u["id"] for u in data["users"] if u["id"] not in data["user_to_groups"]]
 print(f"\n[Pattern 1] Users with NO group memberships: {len(users_no_groups)}")
-for uid in users_no_groups:
-    print(f"  - {uid}")
+emit([f"  - {uid}" for uid in users_no_groups])
 
 # Pattern 2: Empty groups (no members)
-empty_groups = [g["id"] for g in data["groups"] if not data["group_to_users"].get(g["id"])]
+empty_groups = [g["id"] for g in data["groups"] if g["id"] not in data["group_to_users"]]
 print(f"\n[Pattern 2] Empty groups (no members): {len(empty_groups)}")
-for gid in empty_groups:
-    print(f"  - {gid}")
+emit([f"  - {gid}" for gid in empty_groups])
 
 # Pattern 3: Users with most group memberships
 print(f"\n[Pattern 3] Users with most group memberships:")
-sorted_users = sorted(data["user_to_groups"].items(), key=lambda x: len(x[1]), reverse=True)
-for uid, groups in sorted_users[:5]:
+sorted_users = heapq.nlargest(5, data["user_to_groups"].items(), key=lambda x: len(x[1]))
+for uid, groups in sorted_users:
     print(f"  - {uid}: {len(groups)} groups -> {groups}")
 
 # Pattern 4: Groups with most members
 print(f"\n[Pattern 4] Groups with most members:")
-sorted_groups = sorted(data["group_to_users"].items(), key=lambda x: len(x[1]), reverse=True)
-for gid, members in sorted_groups[:5]:
+sorted_groups = heapq.nlargest(5, data["group_to_users"].items(), key=lambda x: len(x[1]))
+for gid, members in sorted_groups:
     print(f"  - {gid}: {len(members)} members")
 
 # Pattern 5: Group hierarchy depth
@@ -252,14 +426,20 @@ else:
 
 # Pattern 6: Permission distribution by workspace
 print(f"\n[Pattern 6] Permissions per workspace:")
-for ws_id, perms in sorted(data["workspace_permissions"].items(), key=lambda x: len(x[1]), reverse=True):
-    if perms:
-        by_type = defaultdict(list)
-        for p in perms:
-            by_type[p["name"]].append(p["assignee_id"])
-        print(f"  - {ws_id}:")
-        for perm_name, assignees in by_type.items():
-            print(f"      {perm_name}: {len(assignees)} assignees")
+# One grouped pass: (workspace, permission) -> assignee count
+assignee_counts = {}
+for ws_id, perms in data["workspace_permissions"].items():
+    for p in perms:
+        key = (ws_id, p["name"])
+        assignee_counts[key] = assignee_counts.get(key, 0) + 1
+# Stable sort keeps each workspace's keys contiguous and in first-seen order
+ordered = sorted(assignee_counts, key=lambda k: len(data["workspace_permissions"][k[0]]), reverse=True)
+lines = []
+for ws_id, keys in itertools.groupby(ordered, key=lambda k: k[0]):
+    lines.append(f"  - {ws_id}:")
+    for key in keys:
+        lines.append(f"      {key[1]}: {assignee_counts[key]} assignees")
+emit(lines)
 
 # ============================================================================
 # ANOMALY DETECTION
@@ -268,61 +448,66 @@ print("\n" + "=" * 70)
 print("ANOMALY DETECTION")
 print("=" * 70)
 
-anomalies = []
+# Anomalies are streamed to a log file; only the count is kept in memory
+anomalies_file = Path(__file__).parent / "anomalies.log"
+anomaly_count = 0
 
-# Anomaly 1: Users with direct permissions (bypassing groups)
-print("\n[Anomaly Check 1] Users with direct workspace permissions (not via groups):")
-for ws_id, perms in data["workspace_permissions"].items():
-    for p in perms:
-        if p["assignee_type"] == "user":
-            anomalies.append(f"Direct user permission: {p['assignee_id']} has '{p['name']}' on {ws_id}")
-            print(f"  ! {p['assignee_id']} has direct '{p['name']}' on workspace '{ws_id}'")
-
-# Anomaly 2: Users in many groups (over-privileged?)
-print("\n[Anomaly Check 2] Users in excessive groups (>3):")
-for uid, groups in data["user_to_groups"].items():
-    if len(groups) > 3:
-        anomalies.append(f"User {uid} is in {len(groups)} groups")
-        print(f"  ! {uid} is in {len(groups)} groups: {groups}")
-
-# Anomaly 3: Workspaces with no permissions assigned
-print("\n[Anomaly Check 3] Workspaces with no explicit permissions:")
-for ws in data["workspaces"]:
-    if ws["id"] not in data["workspace_permissions"] or not data["workspace_permissions"][ws["id"]]:
-        anomalies.append(f"Workspace {ws['id']} has no explicit permissions")
-        print(f"  ! {ws['id']} ({ws.get('name', 'N/A')}) has no explicit permissions")
 
-# Anomaly 4: Orphaned groups (no parent, no members, not used in permissions)
-print("\n[Anomaly Check 4] Potentially orphaned groups:")
-used_groups = set()
-for perms in data["workspace_permissions"].values():
-    for p in perms:
-        if p["assignee_type"] == "userGroup":
-            used_groups.add(p["assignee_id"])
+def record_anomaly(message):
+    global anomaly_count
+    anomaly_count += 1
+    anomaly_log.write(message + "\n")
 
-for g in data["groups"]:
-    gid = g["id"]
-    has_members = bool(data["group_to_users"].get(gid))
-    is_parent = gid in data["group_hierarchy"]
-    is_used = gid in used_groups
-
-    if not has_members and not is_parent and not is_used:
-        anomalies.append(f"Orphaned group: {gid}")
-        print(f"  ! {gid} has no members, no children, and no workspace permissions")
-
-# Anomaly 5: Duplicate permission patterns
-print("\n[Anomaly Check 5] Users with identical group memberships:")
-membership_patterns = defaultdict(list)
-for uid, groups in data["user_to_groups"].items():
-    pattern = tuple(sorted(groups))
-    if pattern:  # Only non-empty patterns
-        membership_patterns[pattern].append(uid)
-
-for pattern, users in membership_patterns.items():
-    if len(users) > 1:
-        print(f"  Users with same groups {list(pattern)}:")
-        for u in users:
-            print(f"    - {u}")
+
+with open(anomalies_file, "w") as anomaly_log:
+    # Anomaly 1: Users with direct permissions (bypassing groups)
+    print("\n[Anomaly Check 1] Users with direct workspace permissions (not via groups):")
+    lines = []
+    for ws_id, perms in data["workspace_permissions"].items():
+        for p in perms:
+            if p["assignee_type"] == "user":
+                record_anomaly(f"Direct user permission: {p['assignee_id']} has '{p['name']}' on {ws_id}")
+                lines.append(f"  ! {p['assignee_id']} has direct '{p['name']}' on workspace '{ws_id}'")
+    emit(lines)
+
+    # Anomaly 2: Users in many groups (over-privileged?)
+    print("\n[Anomaly Check 2] Users in excessive groups (>3):")
+    for uid, groups in data["user_to_groups"].items():
+        if len(groups) > 3:
+            record_anomaly(f"User {uid} is in {len(groups)} groups")
+            print(f"  ! {uid} is in {len(groups)} groups: {groups}")
+
+    # Anomaly 3: Workspaces with no permissions assigned
+    print("\n[Anomaly Check 3] Workspaces with no explicit permissions:")
+    covered = {ws_id for ws_id, perms in data["workspace_permissions"].items() if perms}
+    for ws in data["workspaces"]:
+        if ws["id"] not in covered:
+            record_anomaly(f"Workspace {ws['id']} has no explicit permissions")
+            print(f"  ! {ws['id']} ({ws.get('name', 'N/A')}) has no explicit permissions")
+
+    # Anomaly 4: Orphaned groups (no parent, no members, not used in permissions)
+    print("\n[Anomaly Check 4] Potentially orphaned groups:")
+    # Frozen dicts only hold non-empty entries, so their keys are the "has" sets
+    not_orphaned = data["group_to_users"].keys() | data["group_hierarchy"].keys() | used_groups
+    orphans = [g["id"] for g in data["groups"] if g["id"] not in not_orphaned]
+    for gid in orphans:
+        record_anomaly(f"Orphaned group: {gid}")
+    emit([f"  ! {gid} has no members, no children, and no workspace permissions" for gid in orphans])
+
+    # Anomaly 5: Duplicate permission patterns
+    print("\n[Anomaly Check 5] Users with identical group memberships:")
+    membership_patterns = defaultdict(list)
+    for uid, groups in data["user_to_groups"].items():
+        pattern = frozenset(groups)
+        if pattern:  # Only non-empty patterns
+            membership_patterns[pattern].append(uid)
+
+    for pattern, users in membership_patterns.items():
+        if len(users) > 1:
+            # Sort once per distinct pattern to keep output deterministic
+            print(f"  Users with same groups {sorted(pattern)}:")
+            for u in users:
+                print(f"    - {u}")
 
 # ============================================================================
 # SUMMARY
@@ -333,23 +518,34 @@ print("=" * 70)
 print(f"Total Users:      {len(data['users'])}")
 print(f"Total Groups:     {len(data['groups'])}")
 print(f"Total Workspaces: {len(data['workspaces'])}")
-print(f"Total Anomalies:  {len(anomalies)}")
+print(f"Total Anomalies:  {anomaly_count}")
 
 # Save raw data to JSON for further analysis
 output_file = Path(__file__).parent / "permissions_data.json"
-with open(output_file, "w") as f:
-    # Convert defaultdicts to regular dicts for JSON serialization
-    output_data = {
-        "users": data["users"],
-        "groups": data["groups"],
-        "workspaces": data["workspaces"],
-        "user_to_groups": dict(data["user_to_groups"]),
-        "group_to_users": dict(data["group_to_users"]),
-        "group_hierarchy": dict(data["group_hierarchy"]),
-        "workspace_permissions": dict(data["workspace_permissions"]),
-        "user_permissions": data["user_permissions"],
-        "group_permissions": data["group_permissions"],
-        "anomalies": anomalies,
+
+
+def permission_records(by_principal):
+    """Expand (workspace_id, permission) tuples into JSON objects."""
+    return {
+        ident: [{"workspace_id": ws_id, "permission": name} for ws_id, name in perms]
+        for ident, perms in by_principal.items()
     }
-    json.dump(output_data, f, indent=2)
+
+
+output_data = {
+    "users": data["users"],
+    "groups": data["groups"],
+    "workspaces": data["workspaces"],
+    "user_to_groups": data["user_to_groups"],
+    "group_to_users": data["group_to_users"],
+    "group_hierarchy": data["group_hierarchy"],
+    "workspace_permissions": data["workspace_permissions"],
+    "user_permissions": permission_records(data["user_permissions"]),
+    "group_permissions": permission_records(data["group_permissions"]),
+    "anomalies_log": str(anomalies_file),
+}
+# Compact output: the file is for machine consumption, not reading
+with open(output_file, "wb") as f:
+    f.write(orjson.dumps(output_data))
 print(f"\nRaw data saved to: {output_file}")
+print(f"Anomalies logged to: {anomalies_file}")
@@ -1,9 +1,9 @@
 """Export operations for GoodData dashboards and visualizations."""
 
 import os
-from pathlib import Path
 from typing import Literal
 
+from gooddata_cli.paths import default_export_path
 from gooddata_cli.sdk import get_sdk, get_workspace_id
 
 
@@ -26,17 +26,17 @@ def export_dashboard_pdf(
     ws_id = get_workspace_id(workspace_id)
 
     if output_path is None:
-        output_dir = Path("exports")
-        output_dir.mkdir(exist_ok=True)
-        output_path = str(output_dir / f"{dashboard_id}.pdf")
+        output_path = default_export_path(f"{dashboard_id}.pdf")
+    # The SDK writes to f"{file_name}.pdf"
+    stem = output_path.removesuffix(".pdf")
 
     sdk.export.export_pdf(
         workspace_id=ws_id,
         dashboard_id=dashboard_id,
-        file_name=output_path,
+        file_name=stem,
     )
 
-    return os.path.abspath(output_path)
+    return os.path.abspath(f"{stem}.pdf")
 
 
 def export_visualization_tabular(
@@ -61,18 +61,18 @@ def export_visualization_tabular(
 
     extension = format.lower()
     if output_path is None:
-        output_dir = Path("exports")
-        output_dir.mkdir(exist_ok=True)
-        output_path = str(output_dir / f"{visualization_id}.{extension}")
+        output_path = default_export_path(f"{visualization_id}.{extension}")
+    # The SDK writes to f"{file_name}.{extension}"
+    stem = output_path.removesuffix(f".{extension}")
 
     sdk.export.export_tabular_by_visualization_id(
         workspace_id=ws_id,
         visualization_id=visualization_id,
-        file_name=output_path,
+        file_name=stem,
         file_format=format,
     )
 
-    return os.path.abspath(output_path)
+    return os.path.abspath(f"{stem}.{extension}")
 
 
 def export_insight_to_dataframe(
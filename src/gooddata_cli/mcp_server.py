@@ -8,20 +8,46 @@ Write operations use a two-phase commit pattern (preview → apply) with
 automatic backups and audit logging for safety.
 """
 
+import atexit
+import contextlib
+import gzip
 import hashlib
+import importlib.util
 import json
 import os
+import shutil
 import sys
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from collections.abc import Iterable
+from typing import Any
 
+import orjson
+import requests
 import yaml
+from gooddata_sdk import GoodDataSdk
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 # Ensure the package is importable
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from mcp.server.fastmcp import FastMCP
 
+from gooddata_cli.paths import default_export_path, ensure_dir
+
 # Initialize the MCP server
 mcp = FastMCP("gooddata")
 
@@ -32,18 +58,45 @@ CONFIG_PATH = Path.home() / ".config" / "gooddata" / "workspaces.yaml"
 STACKLESS_GOODDATA_DIR = Path.home() / ".config" / "stackless" / "gooddata"
 
 
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _dump_json(obj: Any) -> str:
+    """Serialize a tool result to compact JSON with orjson.
+
+    orjson writes non-ASCII text as-is, encodes datetimes and numpy values
+    natively, and only falls back to ``default=str`` for anything else (SDK
+    objects). Non-string dict keys, such as DataFrame column labels, are
+    stringified as the stdlib encoder would.
+    """
+    return orjson.dumps(obj, option=_JSON_OPTIONS, default=str).decode()
+
+
+def _dump_json_array(items: Iterable) -> str:
+    """Serialize items as a JSON array one element at a time.
+
+    For generators this avoids holding the full list of row dicts and the
+    encoded output at the same time.
+    """
+    buf = bytearray(b"[")
+    for item in items:
+        buf += orjson.dumps(item, option=_JSON_OPTIONS, default=str)
+        buf += b","
+    if len(buf) > 1:
+        buf[-1:] = b"]"
+    else:
+        buf += b"]"
+    return buf.decode()
+
+
 def _get_backup_dir(customer: str) -> Path:
     """Get customer-specific backup directory."""
-    backup_dir = STACKLESS_GOODDATA_DIR / customer / "backups"
-    backup_dir.mkdir(parents=True, exist_ok=True)
-    return backup_dir
+    return ensure_dir(STACKLESS_GOODDATA_DIR / customer / "backups")
 
 
 def _get_audit_log_path(customer: str) -> Path:
     """Get customer-specific audit log path."""
-    log_dir = STACKLESS_GOODDATA_DIR / customer
-    log_dir.mkdir(parents=True, exist_ok=True)
-    return log_dir / "audit.jsonl"
+    return ensure_dir(STACKLESS_GOODDATA_DIR / customer) / "audit.jsonl"
 
 
 def _save_backup(customer: str, object_type: str, object_id: str, data: dict) -> Path:
@@ -59,25 +112,125 @@ def _save_backup(customer: str, object_type: str, object_id: str, data: dict) ->
         Path to the backup file.
     """
     backup_dir = _get_backup_dir(customer)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     # Use short object ID for filename
-    short_id = object_id[:8] if len(object_id) > 8 else object_id
-    backup_path = backup_dir / f"{object_type}_{short_id}_{timestamp}.json"
+    short_id = object_id[:8]
+    backup_path = backup_dir / f"{object_type}_{short_id}_{timestamp}.json.gz"
 
     backup_data = {
-        "backed_up_at": datetime.now().isoformat(),
+        "backed_up_at": now.isoformat(),
         "customer": customer,
         "object_type": object_type,
         "object_id": object_id,
         "data": data,
     }
 
-    with open(backup_path, "w") as f:
-        json.dump(backup_data, f, indent=2, default=str)
+    # Written synchronously: callers rely on the backup existing before they write
+    with gzip.open(backup_path, "wb", compresslevel=6) as f:
+        f.write(orjson.dumps(backup_data, default=str))
 
     return backup_path
 
 
+@lru_cache(maxsize=32)
+def _load_backup_cached(path: str, mtime_ns: int) -> dict:
+    """Parse a backup file; keyed on mtime so a rewritten file is re-read."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _load_backup(backup_file: Path) -> dict:
+    """Read a backup written by _save_backup (gzip) or an older plain-JSON one.
+
+    The parsed dict is shared between calls, so callers must not modify it.
+    """
+    return _load_backup_cached(str(backup_file), backup_file.stat().st_mtime_ns)
+
+
+class _AuditBatcher:
+    """Buffer audit log lines per file and append them in batches.
+
+    Lines are flushed when a file's buffer reaches ``max_entries`` lines or
+    ``max_bytes`` bytes, by a background thread every ``flush_interval``
+    seconds (followed by an fsync), and for all files at interpreter exit.
+    Each log is opened once with O_APPEND and written with ``os.write``, so
+    appends from several server processes do not interleave.
+    """
+
+    def __init__(
+        self, max_entries: int = 100, max_bytes: int = 65536, flush_interval: float = 0.25
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._buffers: dict[Path, list[bytes]] = {}
+        self._sizes: dict[Path, int] = {}
+        self._fds: dict[Path, int] = {}
+        self._flusher: threading.Thread | None = None
+
+    def append(self, log_path: Path, line: bytes) -> None:
+        """Queue a line for log_path, flushing that file if a threshold is hit."""
+        with self._lock:
+            buf = self._buffers.setdefault(log_path, [])
+            buf.append(line)
+            self._sizes[log_path] = self._sizes.get(log_path, 0) + len(line)
+            if len(buf) >= self.max_entries or self._sizes[log_path] >= self.max_bytes:
+                self._flush_locked(log_path)
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_periodically, name="audit-log-flush", daemon=True
+                )
+                self._flusher.start()
+
+    def flush_all(self, fsync: bool = False) -> None:
+        """Write out every pending line, optionally fsyncing the files written."""
+        with self._lock:
+            for log_path in list(self._buffers):
+                fd = self._flush_locked(log_path)
+                if fsync and fd is not None:
+                    os.fsync(fd)
+
+    def _flush_periodically(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush_all(fsync=True)
+
+    def close(self) -> None:
+        """Flush pending lines and close every open log file."""
+        with self._lock:
+            for log_path in list(self._buffers):
+                self._flush_locked(log_path)
+            for fd in self._fds.values():
+                os.close(fd)
+            self._fds.clear()
+
+    def _fd_locked(self, log_path: Path) -> int:
+        fd = self._fds.get(log_path)
+        if fd is None:
+            fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._fds[log_path] = fd
+        return fd
+
+    def _flush_locked(self, log_path: Path) -> int | None:
+        """Write log_path's pending lines; return the fd written to, if any."""
+        lines = self._buffers.pop(log_path, None)
+        self._sizes.pop(log_path, None)
+        if not lines:
+            return None
+        fd = self._fd_locked(log_path)
+        data = memoryview(b"".join(lines))
+        while data:
+            data = data[os.write(fd, data) :]
+        return fd
+
+
+_audit_batcher = _AuditBatcher()
+atexit.register(_audit_batcher.close)
+
+
 def _log_audit(
     customer: str,
     operation: str,
@@ -104,8 +257,9 @@ def _log_audit(
         "details": details or {},
     }
 
-    with open(log_path, "a") as f:
-        f.write(json.dumps(entry, default=str) + "\n")
+    # Sorted keys give one canonical byte form per entry, ready for hash chaining
+    line = orjson.dumps(entry, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE, default=str)
+    _audit_batcher.append(log_path, line)
 
 
 def _resolve_customer_name(customer: str | None = None) -> str:
@@ -113,46 +267,115 @@ def _resolve_customer_name(customer: str | None = None) -> str:
 
     Similar to _resolve_workspace_id but returns the customer name instead.
     """
-    customers = _load_customer_config()
-    available = ", ".join(customers.keys())
+    return _resolve_customer_cached(_load_customer_config(), customer, os.getcwd())
 
-    if customer is not None:
-        if customer not in customers:
-            raise ValueError(f"Unknown customer '{customer}'. Available: {available}")
-        return customer
 
-    cwd = os.getcwd()
-    for name, cust_config in customers.items():
-        project_path = cust_config.get("project_path", "")
-        if project_path and cwd.startswith(project_path):
-            return name
-
-    raise ValueError(
-        f"Customer must be specified. Available: {available}. "
-        f"Current directory ({cwd}) does not match any customer project."
-    )
+# .env at the repository root, used when present
+_ENV_PATH = Path(__file__).parent.parent.parent / ".env"
+_ENV_LOADED = False
 
 
 def _load_env():
-    """Load environment variables from .env file."""
+    """Load environment variables from .env file, once per process."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+
+    # Deferred so importing the package doesn't pay for python-dotenv
     from dotenv import load_dotenv
 
-    env_path = Path(__file__).parent.parent.parent / ".env"
-    if env_path.exists():
-        load_dotenv(env_path)
+    if _ENV_PATH.exists():
+        load_dotenv(_ENV_PATH)
     else:
         load_dotenv()
+    _ENV_LOADED = True
+
+
+@dataclass(frozen=True, eq=False)
+class _CustomerConfig:
+    """One parsed snapshot of workspaces.yaml.
+
+    Hashed by identity, so each reload is a distinct key for
+    _resolve_customer_cached.
+    """
+
+    mtime: int
+    customers: dict
+    # Comma-joined customer names for error messages
+    available: str
+    # (project_path, name) pairs, longest path first
+    project_paths: tuple[tuple[str, str], ...]
+
 
+# Last loaded config, re-read only when the file's mtime changes
+_CONFIG_CACHE: _CustomerConfig | None = None
 
-def _load_customer_config() -> dict:
-    """Load customer configuration from workspaces.yaml."""
-    if not CONFIG_PATH.exists():
-        raise ValueError(f"Config file not found: {CONFIG_PATH}")
+
+def _load_customer_config() -> _CustomerConfig:
+    """Load customer configuration from workspaces.yaml.
+
+    Returns:
+        The current config snapshot.
+    """
+    global _CONFIG_CACHE
+
+    try:
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise ValueError(f"Config file not found: {CONFIG_PATH}") from None
+
+    config = _CONFIG_CACHE
+    if config is not None and config.mtime == mtime:
+        return config
 
     with open(CONFIG_PATH) as f:
-        config = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=_SafeLoader)
+
+    customers = raw.get("customers", {})
+    project_paths = sorted(
+        (
+            (cust_config["project_path"], name)
+            for name, cust_config in customers.items()
+            if cust_config.get("project_path")
+        ),
+        key=lambda item: len(item[0]),
+        reverse=True,
+    )
+    config = _CustomerConfig(
+        mtime=mtime,
+        customers=customers,
+        available=", ".join(customers.keys()),
+        project_paths=tuple(project_paths),
+    )
+    _CONFIG_CACHE = config
+    return config
+
+
+@lru_cache(maxsize=16)
+def _resolve_customer_cached(config: _CustomerConfig, customer: str | None, cwd: str) -> str:
+    """Resolve the customer name for a (customer, cwd) pair under one config snapshot.
+
+    Failed lookups raise and are therefore never cached.
+    """
+    customers, available = config.customers, config.available
+
+    # 1. Explicit customer parameter
+    if customer is not None:
+        if customer not in customers:
+            raise ValueError(f"Unknown customer '{customer}'. Available: {available}")
+        return customer
+
+    # 2. Auto-detect from current working directory; the longest matching
+    # project_path wins so a nested project is not shadowed by its parent
+    for project_path, name in config.project_paths:
+        if cwd.startswith(project_path):
+            return name
 
-    return config.get("customers", {})
+    # 3. No match - require explicit customer
+    raise ValueError(
+        f"Customer must be specified. Available: {available}. "
+        f"Current directory ({cwd}) does not match any customer project."
+    )
 
 
 def _resolve_workspace_id(customer: str | None = None) -> str:
@@ -169,33 +392,57 @@ def _resolve_workspace_id(customer: str | None = None) -> str:
     Returns:
         The workspace_id for the resolved customer.
     """
-    customers = _load_customer_config()
-    available = ", ".join(customers.keys())
+    config = _load_customer_config()
+    name = _resolve_customer_cached(config, customer, os.getcwd())
+    return config.customers[name]["workspace_id"]
 
-    # 1. Explicit customer parameter
-    if customer is not None:
-        if customer not in customers:
-            raise ValueError(f"Unknown customer '{customer}'. Available: {available}")
-        return customers[customer]["workspace_id"]
 
-    # 2. Auto-detect from current working directory
-    cwd = os.getcwd()
-    for name, cust_config in customers.items():
-        project_path = cust_config.get("project_path", "")
-        if project_path and cwd.startswith(project_path):
-            return cust_config["workspace_id"]
+def _resolve_customer(customer: str | None = None) -> tuple[str, str]:
+    """Resolve both the customer name and its workspace_id with one config check.
 
-    # 3. No match - require explicit customer
-    raise ValueError(
-        f"Customer must be specified. Available: {available}. "
-        f"Current directory ({cwd}) does not match any customer project."
+    Write tools need both; this stats workspaces.yaml once instead of twice.
+    """
+    config = _load_customer_config()
+    name = _resolve_customer_cached(config, customer, os.getcwd())
+    return name, config.customers[name]["workspace_id"]
+
+
+@lru_cache(maxsize=4)
+def _sdk_cached(host: str, token: str):
+    """Create a GoodData SDK instance once per host/token pair."""
+    sdk = GoodDataSdk.create(host, token)
+    _tune_sdk_pool(sdk)
+    return sdk
+
+
+def _tune_sdk_pool(sdk, maxsize: int = 16) -> None:
+    """Size the SDK's keep-alive urllib3 pool and retry transient failures."""
+    try:
+        pool_manager = sdk.client._api_client.rest_client.pool_manager
+    except AttributeError:
+        return
+    # Pools are created lazily per host, so updating the kwargs is enough
+    pool_manager.connection_pool_kw["maxsize"] = maxsize
+    pool_manager.connection_pool_kw["retries"] = Retry(
+        total=3, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504)
     )
 
 
+@lru_cache(maxsize=4)
+def _goodpandas_cached(host: str, token: str):
+    """Create a GoodPandas instance once per host/token pair.
+
+    gooddata_pandas pulls in pandas, so it is only imported by the first tool
+    call that needs a data frame rather than at server startup.
+    """
+    from gooddata_pandas import GoodPandas
+
+    return GoodPandas(host, token)
+
+
 def _get_sdk():
     """Get GoodData SDK instance."""
     _load_env()
-    from gooddata_sdk import GoodDataSdk
 
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -203,7 +450,178 @@ def _get_sdk():
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    return GoodDataSdk.create(host, token)
+    return _sdk_cached(host, token)
+
+
+_http_session: requests.Session | None = None
+
+
+def _get_http_session() -> requests.Session:
+    """Get a shared requests session so HTTPS connections are reused across tool calls.
+
+    The session keeps a small keep-alive pool per host and retries idempotent
+    requests on connection errors and 429/502/503/504 responses.
+    """
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 502, 503, 504)),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
+
+
+# key -> Future of a fetch currently running, shared with concurrent callers
+_inflight: dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _coalesce(key: tuple, fetch):
+    """Run fetch() once for all concurrent callers asking for the same key.
+
+    The first caller performs the fetch; callers arriving while it runs wait
+    for and share its result (or exception). Nothing is kept afterwards.
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = _inflight[key] = Future()
+
+    if not owner:
+        return future.result()
+
+    try:
+        result = fetch()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+# Seconds a fetched workspace model stays valid before it is re-fetched
+_CACHE_TTL = 60.0
+
+
+@dataclass
+class _CachedAnalyticsModel:
+    """A declarative analytics model plus ID lookups built once per fetch."""
+
+    am: Any
+    dashboards_by_id: dict[str, Any]
+    filter_contexts_by_id: dict[str, Any]
+    viz_by_id: dict[str, Any]
+
+    @classmethod
+    def build(cls, am) -> "_CachedAnalyticsModel":
+        analytics = am.analytics
+        return cls(
+            am=am,
+            dashboards_by_id={db.id: db for db in analytics.analytical_dashboards},
+            filter_contexts_by_id={fc.id: fc for fc in analytics.filter_contexts},
+            viz_by_id={viz.id: viz for viz in analytics.visualization_objects},
+        )
+
+
+# ws_id -> (fetched_at, cached analytics model)
+_analytics_model_cache: dict[str, tuple[float, _CachedAnalyticsModel]] = {}
+
+
+def _get_analytics_model(sdk, ws_id: str, max_age: float = _CACHE_TTL) -> _CachedAnalyticsModel:
+    """Get the indexed analytics model for a workspace, cached for max_age seconds."""
+    now = time.monotonic()
+    cached = _analytics_model_cache.get(ws_id)
+    if cached is not None and now - cached[0] < max_age:
+        return cached[1]
+
+    model = _coalesce(
+        ("analytics_model", ws_id),
+        lambda: _CachedAnalyticsModel.build(
+            sdk.catalog_workspace_content.get_declarative_analytics_model(ws_id)
+        ),
+    )
+    _analytics_model_cache[ws_id] = (now, model)
+    return model
+
+
+# ws_id -> (fetched_at, full catalog)
+_full_catalog_cache: dict[str, tuple[float, Any]] = {}
+
+
+def _get_full_catalog(sdk, ws_id: str, max_age: float = _CACHE_TTL):
+    """Get the workspace catalog (metrics, datasets), cached for max_age seconds."""
+    now = time.monotonic()
+    cached = _full_catalog_cache.get(ws_id)
+    if cached is not None and now - cached[0] < max_age:
+        return cached[1]
+
+    catalog = _coalesce(
+        ("full_catalog", ws_id), lambda: sdk.catalog_workspace_content.get_full_catalog(ws_id)
+    )
+    _full_catalog_cache[ws_id] = (now, catalog)
+    return catalog
+
+
+def _invalidate_workspace_cache(ws_id: str) -> None:
+    """Drop cached workspace data after a write so later reads see the change."""
+    _analytics_model_cache.pop(ws_id, None)
+    _full_catalog_cache.pop(ws_id, None)
+
+
+def _dig(d: Any, *path: str) -> Any:
+    """Follow nested dict keys, returning None as soon as a step is missing."""
+    for key in path:
+        if not isinstance(d, dict):
+            return None
+        d = d.get(key)
+        if d is None:
+            return None
+    return d
+
+
+def _measure_metric_id(measure: dict) -> str | None:
+    """Return the metric ID a measure refers to, or None for non-metric measures."""
+    try:
+        return measure["definition"]["measureDefinition"]["item"]["identifier"]["id"]
+    except (KeyError, TypeError):
+        return None
+
+
+# (SDK class, required fields, optional fields) -> row extractor
+_row_extractors: dict[tuple, Any] = {}
+
+
+def _row_extractor(sample: Any, required: tuple[str, ...], optional: tuple[str, ...] = ()):
+    """Build a function turning SDK objects of sample's class into row dicts.
+
+    The class is probed once for which optional fields it carries; rows are
+    then read with a single ``attrgetter`` call, and missing optional fields
+    are filled in as None so the output shape does not depend on SDK version.
+    """
+    cache_key = (type(sample), required, optional)
+    extract = _row_extractors.get(cache_key)
+    if extract is None:
+        present = tuple(f for f in optional if hasattr(sample, f))
+        keys = (*required, *present)
+        absent = dict.fromkeys(f for f in optional if f not in present)
+        # attrgetter returns a bare value rather than a tuple for a single key
+        get_values = attrgetter(*keys) if len(keys) > 1 else lambda obj: (getattr(obj, keys[0]),)
+
+        def extract(obj: Any) -> dict[str, Any]:
+            return dict(zip(keys, get_values(obj)), **absent)
+
+        _row_extractors[cache_key] = extract
+    return extract
 
 
 # =============================================================================
@@ -221,43 +639,45 @@ def list_workspaces() -> str:
     workspaces = sdk.catalog_workspace.list_workspaces()
 
     result = [{"id": ws.id, "name": ws.name} for ws in workspaces]
-    return json.dumps(result, indent=2)
+    return _dump_json(result)
 
 
 @mcp.tool()
-def list_insights(customer: str | None = None) -> str:
+def list_insights(customer: str | None = None, refresh: bool = False) -> str:
     """List all insights (visualizations) in a workspace.
 
     Args:
         customer: The customer name (tpp, dlg, danceone). Auto-detects from CWD if not provided.
+        refresh: Bypass the short-lived workspace cache and fetch fresh data.
 
     Returns a JSON array of insights with their IDs and titles.
     """
     sdk = _get_sdk()
     ws_id = _resolve_workspace_id(customer)
 
-    am = sdk.catalog_workspace_content.get_declarative_analytics_model(ws_id)
+    model = _get_analytics_model(sdk, ws_id, 0 if refresh else _CACHE_TTL)
 
-    result = [{"id": viz.id, "title": viz.title} for viz in am.analytics.visualization_objects]
-    return json.dumps(result, indent=2)
+    result = [{"id": viz.id, "title": viz.title} for viz in model.viz_by_id.values()]
+    return _dump_json(result)
 
 
 @mcp.tool()
-def list_dashboards(customer: str | None = None) -> str:
+def list_dashboards(customer: str | None = None, refresh: bool = False) -> str:
     """List all dashboards in a workspace.
 
     Args:
         customer: The customer name (tpp, dlg, danceone). Auto-detects from CWD if not provided.
+        refresh: Bypass the short-lived workspace cache and fetch fresh data.
 
     Returns a JSON array of dashboards with their IDs and titles.
     """
     sdk = _get_sdk()
     ws_id = _resolve_workspace_id(customer)
 
-    am = sdk.catalog_workspace_content.get_declarative_analytics_model(ws_id)
+    model = _get_analytics_model(sdk, ws_id, 0 if refresh else _CACHE_TTL)
 
-    result = [{"id": db.id, "title": db.title} for db in am.analytics.analytical_dashboards]
-    return json.dumps(result, indent=2)
+    result = [{"id": db.id, "title": db.title} for db in model.dashboards_by_id.values()]
+    return _dump_json(result)
 
 
 @mcp.tool()
@@ -276,40 +696,36 @@ def get_dashboard_filters(dashboard_id: str, customer: str | None = None) -> str
     sdk = _get_sdk()
     ws_id = _resolve_workspace_id(customer)
 
-    am = sdk.catalog_workspace_content.get_declarative_analytics_model(ws_id)
-
-    # Find the dashboard
-    dashboard = None
-    for db in am.analytics.analytical_dashboards:
-        if db.id == dashboard_id:
-            dashboard = db
-            break
+    model = _get_analytics_model(sdk, ws_id)
 
+    dashboard = model.dashboards_by_id.get(dashboard_id)
     if not dashboard:
-        return json.dumps({"error": f"Dashboard '{dashboard_id}' not found"})
+        return _dump_json({"error": f"Dashboard '{dashboard_id}' not found"})
 
     content = dashboard.content
 
     # Extract filter context reference
-    filter_context_ref = content.get("filterContextRef", {})
-    filter_context_id = filter_context_ref.get("identifier", {}).get("id")
+    filter_context_id = _dig(content, "filterContextRef", "identifier", "id")
 
     # Look up the filterContext object to get the actual filters
     filter_context_content = None
     if filter_context_id:
-        for fc in am.analytics.filter_contexts:
-            if fc.id == filter_context_id:
-                filter_context_content = fc.content
-                break
+        fc = model.filter_contexts_by_id.get(filter_context_id)
+        if fc is not None:
+            filter_context_content = fc.content
 
     # Parse the filters from the filter context
     attribute_filters = []
     date_filters = []
 
     if filter_context_content:
-        for f in filter_context_content.get("filters", []):
-            if "attributeFilter" in f:
-                af = f["attributeFilter"]
+        add_attribute_filter = attribute_filters.append
+        add_date_filter = date_filters.append
+        # Each filter is a single-key dict: {"attributeFilter": {...}} or {"dateFilter": {...}}
+        for f in filter_context_content.get("filters", ()):
+            kind = next(iter(f), None)
+            if kind == "attributeFilter":
+                af = f[kind]
                 # Handle both nested and flat identifier formats
                 display_form = af.get("displayForm", {})
                 identifier = display_form.get("identifier", display_form)
@@ -318,19 +734,19 @@ def get_dashboard_filters(dashboard_id: str, customer: str | None = None) -> str
                 else:
                     display_form_id = identifier
 
-                attribute_filters.append(
+                add_attribute_filter(
                     {
                         "displayForm": display_form_id,
                         "localIdentifier": af.get("localIdentifier"),
                         "negativeSelection": af.get("negativeSelection", False),
                         "selectionMode": af.get("selectionMode", "multi"),
-                        "selectedValues": af.get("attributeElements", {}).get("uris", []),
+                        "selectedValues": _dig(af, "attributeElements", "uris") or [],
                     }
                 )
 
-            elif "dateFilter" in f:
-                df = f["dateFilter"]
-                date_filters.append(
+            elif kind == "dateFilter":
+                df = f[kind]
+                add_date_filter(
                     {
                         "type": df.get("type"),
                         "granularity": df.get("granularity"),
@@ -349,7 +765,7 @@ def get_dashboard_filters(dashboard_id: str, customer: str | None = None) -> str
         "date_filters": date_filters,
         "date_filter_count": len(date_filters),
     }
-    return json.dumps(result, indent=2, default=str)
+    return _dump_json(result)
 
 
 @mcp.tool()
@@ -365,20 +781,13 @@ def get_dashboard_insights(dashboard_id: str, customer: str | None = None) -> st
     sdk = _get_sdk()
     ws_id = _resolve_workspace_id(customer)
 
-    am = sdk.catalog_workspace_content.get_declarative_analytics_model(ws_id)
-
-    # Find the dashboard
-    dashboard = None
-    for db in am.analytics.analytical_dashboards:
-        if db.id == dashboard_id:
-            dashboard = db
-            break
+    model = _get_analytics_model(sdk, ws_id)
 
+    dashboard = model.dashboards_by_id.get(dashboard_id)
     if not dashboard:
-        return json.dumps({"error": f"Dashboard '{dashboard_id}' not found"})
+        return _dump_json({"error": f"Dashboard '{dashboard_id}' not found"})
 
-    # Build a lookup of all visualization objects by ID
-    viz_lookup = {viz.id: viz.title for viz in am.analytics.visualization_objects}
+    viz_by_id = model.viz_by_id
 
     # Extract insight IDs from dashboard layout
     insight_ids = []
@@ -399,7 +808,11 @@ def get_dashboard_insights(dashboard_id: str, customer: str | None = None) -> st
                         insight_ids.append(
                             {
                                 "id": insight_id,
-                                "title": viz_lookup.get(insight_id, widget.get("title", "")),
+                                "title": (
+                                    viz_by_id[insight_id].title
+                                    if insight_id in viz_by_id
+                                    else widget.get("title", "")
+                                ),
                                 "widget_title": widget.get("title", ""),
                             }
                         )
@@ -410,65 +823,100 @@ def get_dashboard_insights(dashboard_id: str, customer: str | None = None) -> st
         "insights": insight_ids,
         "insight_count": len(insight_ids),
     }
-    return json.dumps(result, indent=2)
+    return _dump_json(result)
+
+
+_METRIC_FIELDS = (
+    "format",
+    "is_hidden",
+    "obj_id",
+    "json_api_attributes",
+    "json_api_related_entities_data",
+    "json_api_related_entities_side_loads",
+    "json_api_relationships",
+    "json_api_side_loads",
+)
 
 
 @mcp.tool()
-def list_metrics(customer: str | None = None) -> str:
+def list_metrics(customer: str | None = None, refresh: bool = False) -> str:
     """List all metrics in a workspace.
 
     Args:
         customer: The customer name (tpp, dlg, danceone). Auto-detects from CWD if not provided.
+        refresh: Bypass the short-lived workspace cache and fetch fresh data.
 
     Returns a JSON array of metrics with all available properties.
     """
     sdk = _get_sdk()
     ws_id = _resolve_workspace_id(customer)
 
-    catalog = sdk.catalog_workspace_content.get_full_catalog(ws_id)
+    catalog = _get_full_catalog(sdk, ws_id, 0 if refresh else _CACHE_TTL)
 
-    result = [
-        {
-            "id": m.id,
-            "title": m.title,
-            "format": getattr(m, "format", None),
-            "is_hidden": getattr(m, "is_hidden", None),
-            "obj_id": getattr(m, "obj_id", None),
-            "json_api_attributes": getattr(m, "json_api_attributes", None),
-            "json_api_related_entities_data": getattr(m, "json_api_related_entities_data", None),
-            "json_api_related_entities_side_loads": getattr(
-                m, "json_api_related_entities_side_loads", None
-            ),
-            "json_api_relationships": getattr(m, "json_api_relationships", None),
-            "json_api_side_loads": getattr(m, "json_api_side_loads", None),
-        }
-        for m in catalog.metrics
-    ]
-    return json.dumps(result, indent=2, default=str)
+    metrics = catalog.metrics
+    if not metrics:
+        return _dump_json([])
+    extract = _row_extractor(metrics[0], ("id", "title"), _METRIC_FIELDS)
+    return _dump_json_array(extract(m) for m in metrics)
 
 
 @mcp.tool()
-def list_datasets(customer: str | None = None) -> str:
+def list_datasets(customer: str | None = None, refresh: bool = False) -> str:
     """List all datasets in a workspace.
 
     Args:
         customer: The customer name (tpp, dlg, danceone). Auto-detects from CWD if not provided.
+        refresh: Bypass the short-lived workspace cache and fetch fresh data.
 
     Returns a JSON array of datasets with their IDs and titles.
     """
     sdk = _get_sdk()
     ws_id = _resolve_workspace_id(customer)
 
-    catalog = sdk.catalog_workspace_content.get_full_catalog(ws_id)
+    catalog = _get_full_catalog(sdk, ws_id, 0 if refresh else _CACHE_TTL)
 
     result = [{"id": ds.id, "title": ds.title} for ds in catalog.datasets]
-    return json.dumps(result, indent=2)
+    return _dump_json(result)
+
+
+@mcp.tool()
+def list_workspace_overview(customer: str | None = None, refresh: bool = False) -> str:
+    """List insights, dashboards, metrics and datasets of a workspace in one call.
+
+    The analytics model and the catalog are fetched concurrently and land in
+    the same cache the individual list_* tools use.
+
+    Args:
+        customer: The customer name (tpp, dlg, danceone). Auto-detects from CWD if not provided.
+        refresh: Bypass the short-lived workspace cache and fetch fresh data.
+
+    Returns a JSON object with id/title arrays for each object type.
+    """
+    sdk = _get_sdk()
+    ws_id = _resolve_workspace_id(customer)
+    max_age = 0 if refresh else _CACHE_TTL
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        model_future = executor.submit(_get_analytics_model, sdk, ws_id, max_age)
+        catalog_future = executor.submit(_get_full_catalog, sdk, ws_id, max_age)
+        model = model_future.result()
+        catalog = catalog_future.result()
+
+    result = {
+        "workspace_id": ws_id,
+        "insights": [{"id": viz.id, "title": viz.title} for viz in model.viz_by_id.values()],
+        "dashboards": [{"id": db.id, "title": db.title} for db in model.dashboards_by_id.values()],
+        "metrics": [{"id": m.id, "title": m.title} for m in catalog.metrics],
+        "datasets": [{"id": ds.id, "title": ds.title} for ds in catalog.datasets],
+    }
+    return _dump_json(result)
 
 
 @mcp.tool()
 def get_logical_data_model(
     customer: str | None = None,
     output_path: str | None = None,
+    summary_only: bool = False,
 ) -> str:
     """Get the logical data model (LDM) for a workspace.
 
@@ -478,6 +926,7 @@ def get_logical_data_model(
     Args:
         customer: The customer name (tpp, dlg, danceone). Auto-detects from CWD if not provided.
         output_path: Optional file path to save the LDM. If provided, saves as JSON file.
+        summary_only: If True, omit the full LDM from the response and return only the summary.
 
     Returns:
         JSON containing the full logical data model structure, or path to saved file.
@@ -516,26 +965,26 @@ def get_logical_data_model(
         if output_dir and str(output_dir) != ".":
             output_dir.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w") as f:
-            json.dump(ldm_dict, f, indent=2, default=str)
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(ldm_dict, option=orjson.OPT_INDENT_2, default=str))
 
-        return json.dumps(
+        return _dump_json(
             {
                 "success": True,
                 "path": os.path.abspath(output_path),
                 "summary": summary,
-            },
-            indent=2,
+            }
         )
 
+    if summary_only:
+        return _dump_json({"summary": summary})
+
     # Return summary with full LDM
-    return json.dumps(
+    return _dump_json(
         {
             "summary": summary,
             "ldm": ldm_dict,
-        },
-        indent=2,
-        default=str,
+        }
     )
 
 
@@ -544,6 +993,48 @@ def get_logical_data_model(
 # =============================================================================
 
 
+# (host, name) -> (fetched_at, value) for organization-wide lookups
+_org_cache: dict[tuple[str, str], tuple[float, Any]] = {}
+
+
+def _get_org_cached(sdk, name: str, fetch):
+    """Return fetch() cached per organization host under name for _CACHE_TTL seconds."""
+    key = (sdk.client.endpoint, name)
+    now = time.monotonic()
+    cached = _org_cache.get(key)
+    if cached is not None and now - cached[0] < _CACHE_TTL:
+        return cached[1]
+
+    value = _coalesce(("org", *key), fetch)
+    _org_cache[key] = (now, value)
+    return value
+
+
+@dataclass
+class _CachedUsers:
+    """Declarative users plus a group -> member IDs index built once per fetch."""
+
+    users: list[Any]
+    members_by_group: dict[str, list[str]]
+
+    @classmethod
+    def build(cls, decl_users) -> "_CachedUsers":
+        members_by_group: dict[str, list[str]] = {}
+        for u in decl_users.users:
+            for group_id in dict.fromkeys(ug.id for ug in u.user_groups or ()):
+                members_by_group.setdefault(group_id, []).append(u.id)
+        return cls(users=decl_users.users, members_by_group=members_by_group)
+
+
+def _get_declarative_users(sdk) -> _CachedUsers:
+    """Fetch the organization's declarative users (with group links) once per TTL."""
+    return _get_org_cached(
+        sdk,
+        "declarative_users",
+        lambda: _CachedUsers.build(sdk.catalog_user.get_declarative_users()),
+    )
+
+
 @mcp.tool()
 def list_users() -> str:
     """List all users in the GoodData organization.
@@ -551,17 +1042,20 @@ def list_users() -> str:
     Returns a JSON array of users with their IDs and names.
     """
     sdk = _get_sdk()
-    users = sdk.catalog_user.list_users()
+    # One declarative fetch, shared with get_user_group_members
+    users = _get_declarative_users(sdk).users
 
-    result = [
-        {
-            "id": u.id,
-            "name": getattr(u, "name", None),
-            "email": getattr(u, "email", None),
-        }
-        for u in users
-    ]
-    return json.dumps(result, indent=2)
+    if not users:
+        return _dump_json([])
+    # Older SDKs' declarative users carry no name or email fields
+    extract = _row_extractor(users[0], ("id",), ("firstname", "lastname", "email"))
+
+    def to_row(u) -> dict[str, Any]:
+        row = extract(u)
+        name = " ".join(filter(None, (row.pop("firstname"), row.pop("lastname"))))
+        return {"id": row["id"], "name": name or None, "email": row["email"]}
+
+    return _dump_json_array(to_row(u) for u in users)
 
 
 @mcp.tool()
@@ -571,10 +1065,12 @@ def list_user_groups() -> str:
     Returns a JSON array of groups with their IDs and names.
     """
     sdk = _get_sdk()
-    groups = sdk.catalog_user.list_user_groups()
+    groups = _get_org_cached(sdk, "user_groups", sdk.catalog_user.list_user_groups)
 
-    result = [{"id": g.id, "name": getattr(g, "name", None)} for g in groups]
-    return json.dumps(result, indent=2)
+    if not groups:
+        return _dump_json([])
+    extract = _row_extractor(groups[0], ("id",), ("name",))
+    return _dump_json([extract(g) for g in groups])
 
 
 @mcp.tool()
@@ -587,17 +1083,9 @@ def get_user_group_members(group_id: str) -> str:
     Returns a JSON array of user IDs in the group.
     """
     sdk = _get_sdk()
-    decl_users = sdk.catalog_user.get_declarative_users()
+    members = _get_declarative_users(sdk).members_by_group.get(group_id, [])
 
-    members = []
-    for u in decl_users.users:
-        if u.user_groups:
-            for ug in u.user_groups:
-                if ug.id == group_id:
-                    members.append(u.id)
-                    break
-
-    return json.dumps({"group_id": group_id, "members": members}, indent=2)
+    return _dump_json({"group_id": group_id, "members": members})
 
 
 # =============================================================================
@@ -605,39 +1093,20 @@ def get_user_group_members(group_id: str) -> str:
 # =============================================================================
 
 
-@mcp.tool()
-def get_insight_metadata(insight_id: str, customer: str | None = None) -> str:
-    """Get detailed metadata for a specific insight/visualization.
-
-    Returns metadata including tags, creation/modification dates, creator info,
-    and related objects (metrics, attributes, datasets).
+def _fetch_insight_metadata(host: str, token: str, ws_id: str, insight_id: str) -> dict:
+    """Fetch and flatten metadata for one visualization object.
 
-    Args:
-        insight_id: The insight ID to get metadata for.
-        customer: The customer name (tpp, dlg, danceone). Auto-detects from CWD if not provided.
-
-    Returns metadata as JSON including:
-        - id, title, description
-        - tags (array of strings)
-        - createdAt, modifiedAt (timestamps)
-        - createdBy, modifiedBy (user info)
-        - origin (originType, originId)
-        - visualizationType (e.g., "table", "bar", "line")
-        - filters (applied filters)
-        - metrics (referenced metrics)
-        - attributes (referenced attributes)
+    Shared by get_insight_metadata and get_insights_metadata_bulk. Concurrent
+    requests for the same insight share one HTTP call.
     """
-    import requests
-
-    _load_env()
-    host = os.getenv("GOODDATA_HOST")
-    token = os.getenv("GOODDATA_TOKEN")
+    return _coalesce(
+        ("insight_metadata", host, ws_id, insight_id),
+        lambda: _request_insight_metadata(host, token, ws_id, insight_id),
+    )
 
-    if not host or not token:
-        raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
-
-    ws_id = _resolve_workspace_id(customer)
 
+def _request_insight_metadata(host: str, token: str, ws_id: str, insight_id: str) -> dict:
+    """Request one visualization object and flatten its metadata."""
     # Make direct API request to get full metadata
     url = f"{host}/api/v1/entities/workspaces/{ws_id}/visualizationObjects/{insight_id}"
     params = {"include": "createdBy,modifiedBy"}
@@ -646,9 +1115,9 @@ def get_insight_metadata(insight_id: str, customer: str | None = None) -> str:
         "Content-Type": "application/json",
     }
 
-    response = requests.get(url, headers=headers, params=params)
+    response = _get_http_session().get(url, headers=headers, params=params)
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
     viz_data = data.get("data", {})
     attrs = viz_data.get("attributes", {})
@@ -656,21 +1125,25 @@ def get_insight_metadata(insight_id: str, customer: str | None = None) -> str:
     meta = viz_data.get("meta", {})
     included = data.get("included", [])
 
-    # Build user lookup from included data
-    user_lookup = {}
-    for item in included:
-        if item.get("type") == "userIdentifier":
-            user_attrs = item.get("attributes", {})
-            user_lookup[item["id"]] = {
-                "id": item["id"],
-                "firstname": user_attrs.get("firstname"),
-                "lastname": user_attrs.get("lastname"),
-                "email": user_attrs.get("email"),
-            }
-
     # Extract creator/modifier info
-    created_by_id = relationships.get("createdBy", {}).get("data", {}).get("id")
-    modified_by_id = relationships.get("modifiedBy", {}).get("data", {}).get("id")
+    created_by_id = _dig(relationships, "createdBy", "data", "id")
+    modified_by_id = _dig(relationships, "modifiedBy", "data", "id")
+
+    # Build user lookup from included data, stopping once both users are found
+    wanted = {created_by_id, modified_by_id} - {None}
+    user_lookup = {}
+    for item in included if wanted else ():
+        if item.get("type") != "userIdentifier" or item.get("id") not in wanted:
+            continue
+        user_attrs = item.get("attributes", {})
+        user_lookup[item["id"]] = {
+            "id": item["id"],
+            "firstname": user_attrs.get("firstname"),
+            "lastname": user_attrs.get("lastname"),
+            "email": user_attrs.get("email"),
+        }
+        if len(user_lookup) == len(wanted):
+            break
 
     # Extract visualization type from content
     content = attrs.get("content", {})
@@ -684,13 +1157,7 @@ def get_insight_metadata(insight_id: str, customer: str | None = None) -> str:
         for item in bucket.get("items", []):
             if "measure" in item:
                 measure = item["measure"]
-                metric_id = (
-                    measure.get("definition", {})
-                    .get("measureDefinition", {})
-                    .get("item", {})
-                    .get("identifier", {})
-                    .get("id")
-                )
+                metric_id = _measure_metric_id(measure)
                 if metric_id:
                     metrics.append(
                         {
@@ -745,7 +1212,90 @@ def get_insight_metadata(insight_id: str, customer: str | None = None) -> str:
         "areRelationsValid": attrs.get("areRelationsValid", attrs.get("are_relations_valid")),
     }
 
-    return json.dumps(result, indent=2, default=str)
+    return result
+
+
+@mcp.tool()
+def get_insight_metadata(insight_id: str, customer: str | None = None) -> str:
+    """Get detailed metadata for a specific insight/visualization.
+
+    Returns metadata including tags, creation/modification dates, creator info,
+    and related objects (metrics, attributes, datasets).
+
+    Args:
+        insight_id: The insight ID to get metadata for.
+        customer: The customer name (tpp, dlg, danceone). Auto-detects from CWD if not provided.
+
+    Returns metadata as JSON including:
+        - id, title, description
+        - tags (array of strings)
+        - createdAt, modifiedAt (timestamps)
+        - createdBy, modifiedBy (user info)
+        - origin (originType, originId)
+        - visualizationType (e.g., "table", "bar", "line")
+        - filters (applied filters)
+        - metrics (referenced metrics)
+        - attributes (referenced attributes)
+    """
+    _load_env()
+    host = os.getenv("GOODDATA_HOST")
+    token = os.getenv("GOODDATA_TOKEN")
+
+    if not host or not token:
+        raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
+
+    ws_id = _resolve_workspace_id(customer)
+
+    return _dump_json(_fetch_insight_metadata(host, token, ws_id, insight_id))
+
+
+@mcp.tool()
+def get_insights_metadata_bulk(insight_ids: list[str], customer: str | None = None) -> str:
+    """Get detailed metadata for several insights/visualizations at once.
+
+    Fetches are issued concurrently, which is much faster than calling
+    get_insight_metadata once per insight (e.g. for every insight on a dashboard).
+
+    Args:
+        insight_ids: The insight IDs to get metadata for.
+        customer: The customer name (tpp, dlg, danceone). Auto-detects from CWD if not provided.
+
+    Returns:
+        JSON with:
+        - insights: Metadata per insight, in request order (same shape as get_insight_metadata)
+        - errors: Insights that could not be fetched, with the error message
+    """
+    _load_env()
+    host = os.getenv("GOODDATA_HOST")
+    token = os.getenv("GOODDATA_TOKEN")
+
+    if not host or not token:
+        raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
+
+    ws_id = _resolve_workspace_id(customer)
+
+    def fetch(insight_id: str) -> tuple[str, dict | None, str | None]:
+        try:
+            return insight_id, _fetch_insight_metadata(host, token, ws_id, insight_id), None
+        except Exception as e:
+            return insight_id, None, str(e)
+
+    insights = []
+    errors = []
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for insight_id, metadata, error in executor.map(fetch, insight_ids):
+            if error is None:
+                insights.append(metadata)
+            else:
+                errors.append({"id": insight_id, "error": error})
+
+    return _dump_json(
+        {
+            "insights": insights,
+            "insight_count": len(insights),
+            "errors": errors,
+        }
+    )
 
 
 @mcp.tool()
@@ -759,8 +1309,6 @@ def get_insight_data(insight_id: str, customer: str | None = None) -> str:
     Returns the insight data as JSON with metadata and rows.
     """
     _load_env()
-    from gooddata_sdk import GoodDataSdk
-    from gooddata_pandas import GoodPandas
 
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -771,11 +1319,11 @@ def get_insight_data(insight_id: str, customer: str | None = None) -> str:
     ws_id = _resolve_workspace_id(customer)
 
     # Get visualization metadata
-    sdk = GoodDataSdk.create(host, token)
+    sdk = _sdk_cached(host, token)
     viz = sdk.visualizations.get_visualization(ws_id, insight_id)
 
     # Get data via GoodPandas
-    gp = GoodPandas(host, token)
+    gp = _goodpandas_cached(host, token)
     df = gp.data_frames(ws_id).for_visualization(insight_id)
 
     result = {
@@ -784,10 +1332,13 @@ def get_insight_data(insight_id: str, customer: str | None = None) -> str:
         "description": viz.description,
         "columns": list(df.columns),
         "row_count": len(df),
-        "data": df.to_dict(orient="records") if len(df) > 0 else [],
+        # pandas serializes the rows in C; orjson embeds the result verbatim
+        "data": orjson.Fragment(
+            df.to_json(orient="records", date_format="iso", default_handler=str)
+        ),
     }
 
-    return json.dumps(result, indent=2, default=str)
+    return _dump_json(result)
 
 
 # =============================================================================
@@ -795,48 +1346,125 @@ def get_insight_data(insight_id: str, customer: str | None = None) -> str:
 # =============================================================================
 
 
+# Long-running exports run here so the server stays responsive meanwhile
+_export_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="export")
+
+# job_id -> (Future of the export, absolute output path, submitted_at)
+_export_jobs: dict[str, tuple[Future, str, float]] = {}
+
+# Finished jobs nobody asked about are dropped after this many seconds
+_EXPORT_JOB_TTL = 3600.0
+
+
+def _evict_export_jobs() -> None:
+    """Forget finished export jobs older than _EXPORT_JOB_TTL."""
+    now = time.monotonic()
+    stale = [
+        job_id
+        for job_id, (future, _, submitted_at) in _export_jobs.items()
+        if future.done() and now - submitted_at >= _EXPORT_JOB_TTL
+    ]
+    for job_id in stale:
+        del _export_jobs[job_id]
+
+
 @mcp.tool()
 def export_dashboard_pdf(
     dashboard_id: str,
     customer: str | None = None,
     output_path: str | None = None,
 ) -> str:
-    """Export a dashboard to PDF.
+    """Start exporting a dashboard to PDF in the background.
 
     Args:
         dashboard_id: The dashboard ID to export.
         customer: The customer name (tpp, dlg, danceone). Auto-detects from CWD if not provided.
         output_path: Optional output file path. Defaults to ./exports/<dashboard_id>.pdf
 
-    Returns the path to the exported file.
+    Returns a job_id and the target path. Poll get_export_status(job_id) until
+    the status is "done" (or "failed").
     """
     sdk = _get_sdk()
     ws_id = _resolve_workspace_id(customer)
 
     if output_path is None:
-        output_dir = Path("exports")
-        output_dir.mkdir(exist_ok=True)
-        output_path = str(output_dir / f"{dashboard_id}.pdf")
+        output_path = default_export_path(f"{dashboard_id}.pdf")
+    # The SDK writes to f"{file_name}.pdf", so hand it the path without the suffix
+    stem = os.path.abspath(output_path.removesuffix(".pdf"))
+    abs_path = stem + ".pdf"
 
-    sdk.export.export_pdf(
+    future = _export_executor.submit(
+        sdk.export.export_pdf,
         workspace_id=ws_id,
         dashboard_id=dashboard_id,
-        file_name=output_path,
+        file_name=stem,
     )
+    _evict_export_jobs()
+    job_id = uuid.uuid4().hex
+    _export_jobs[job_id] = (future, abs_path, time.monotonic())
 
-    return json.dumps(
+    return _dump_json(
         {
-            "success": True,
-            "path": os.path.abspath(output_path),
+            "job_id": job_id,
+            "status": "pending",
+            "path": abs_path,
         }
     )
 
 
+@mcp.tool()
+def get_export_status(job_id: str) -> str:
+    """Check on a background export started by export_dashboard_pdf.
+
+    Args:
+        job_id: The job_id returned when the export was started.
+
+    Returns the job status ("running", "done" or "failed"), the output path,
+    and the error message for failed jobs. A finished job is forgotten once
+    its status has been reported.
+    """
+    job = _export_jobs.get(job_id)
+    if job is None:
+        return _dump_json({"error": f"Export job '{job_id}' not found"})
+
+    future, path, _ = job
+    result = {"job_id": job_id, "path": path}
+    if not future.done():
+        result["status"] = "running"
+        return _dump_json(result)
+
+    _export_jobs.pop(job_id, None)
+    if future.exception() is not None:
+        result["status"] = "failed"
+        result["error"] = str(future.exception())
+    else:
+        result["status"] = "done"
+    return _dump_json(result)
+
+
+# compression name -> file suffix appended to the CSV path
+_CSV_COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def _compress_file(src: str, dest: str, compression: str) -> None:
+    """Stream-compress src into dest with gzip or zstd."""
+    with open(src, "rb") as fin:
+        if compression == "gzip":
+            with gzip.open(dest, "wb", compresslevel=6) as fout:
+                shutil.copyfileobj(fin, fout, 1 << 20)
+        else:
+            import zstandard
+
+            with open(dest, "wb") as fout:
+                zstandard.ZstdCompressor().copy_stream(fin, fout)
+
+
 @mcp.tool()
 def export_visualization_csv(
     visualization_id: str,
     customer: str | None = None,
     output_path: str | None = None,
+    compression: str = "none",
 ) -> str:
     """Export a visualization to CSV.
 
@@ -844,25 +1472,54 @@ def export_visualization_csv(
         visualization_id: The visualization ID to export.
         customer: The customer name (tpp, dlg, danceone). Auto-detects from CWD if not provided.
         output_path: Optional output file path. Defaults to ./exports/<visualization_id>.csv
+            A path ending in .csv.gz or .csv.zst selects that compression.
+        compression: "none", "gzip" or "zstd" (zstd needs the zstandard package).
+            The matching suffix is appended to the output path.
 
     Returns the path to the exported file.
     """
+    if output_path is not None and compression == "none":
+        for name, suffix in _CSV_COMPRESSION_SUFFIXES.items():
+            if output_path.endswith(".csv" + suffix):
+                compression = name
+                break
+    if compression != "none":
+        if compression not in _CSV_COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown compression '{compression}'. Use none, gzip or zstd.")
+        if compression == "zstd" and importlib.util.find_spec("zstandard") is None:
+            raise ValueError("zstd compression requires the zstandard package")
+
     sdk = _get_sdk()
     ws_id = _resolve_workspace_id(customer)
 
     if output_path is None:
-        output_dir = Path("exports")
-        output_dir.mkdir(exist_ok=True)
-        output_path = str(output_dir / f"{visualization_id}.csv")
+        output_path = default_export_path(f"{visualization_id}.csv")
+
+    # The SDK writes plain CSV to f"{file_name}.csv"; compressed exports are
+    # encoded from that file
+    if compression != "none":
+        suffix = _CSV_COMPRESSION_SUFFIXES[compression]
+        output_path = output_path.removesuffix(suffix)
+    stem = output_path.removesuffix(".csv")
+    csv_path = stem + ".csv"
 
     sdk.export.export_tabular_by_visualization_id(
         workspace_id=ws_id,
         visualization_id=visualization_id,
-        file_name=output_path,
+        file_name=stem,
         file_format="CSV",
     )
 
-    return json.dumps(
+    output_path = csv_path
+    if compression != "none":
+        output_path = csv_path + suffix
+        try:
+            _compress_file(csv_path, output_path, compression)
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(csv_path)
+
+    return _dump_json(
         {
             "success": True,
             "path": os.path.abspath(output_path),
@@ -889,21 +1546,21 @@ def export_visualization_xlsx(
     ws_id = _resolve_workspace_id(customer)
 
     if output_path is None:
-        output_dir = Path("exports")
-        output_dir.mkdir(exist_ok=True)
-        output_path = str(output_dir / f"{visualization_id}.xlsx")
+        output_path = default_export_path(f"{visualization_id}.xlsx")
+    # The SDK writes to f"{file_name}.xlsx"
+    stem = output_path.removesuffix(".xlsx")
 
     sdk.export.export_tabular_by_visualization_id(
         workspace_id=ws_id,
         visualization_id=visualization_id,
-        file_name=output_path,
+        file_name=stem,
         file_format="XLSX",
     )
 
-    return json.dumps(
+    return _dump_json(
         {
             "success": True,
-            "path": os.path.abspath(output_path),
+            "path": os.path.abspath(stem + ".xlsx"),
         }
     )
 
@@ -930,8 +1587,6 @@ def get_metric(metric_id: str, customer: str | None = None) -> str:
         - maql (the metric definition)
         - tags, createdAt, modifiedAt
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -947,9 +1602,9 @@ def get_metric(metric_id: str, customer: str | None = None) -> str:
         "Accept": "application/vnd.gooddata.api+json",
     }
 
-    response = requests.get(url, headers=headers)
+    response = _get_http_session().get(url, headers=headers)
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
     attrs = data["data"]["attributes"]
     content = attrs.get("content", {})
@@ -965,7 +1620,7 @@ def get_metric(metric_id: str, customer: str | None = None) -> str:
         "modifiedAt": attrs.get("modifiedAt"),
     }
 
-    return json.dumps(result, indent=2, default=str)
+    return _dump_json(result)
 
 
 @mcp.tool()
@@ -999,8 +1654,6 @@ def preview_update_metric(
         - confirmation_token: Token to pass to apply_update_metric
         - next_step: Instructions for applying the change
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -1008,8 +1661,7 @@ def preview_update_metric(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Fetch current metric definition
     url = f"{host}/api/v1/entities/workspaces/{ws_id}/metrics/{metric_id}"
@@ -1018,9 +1670,9 @@ def preview_update_metric(
         "Accept": "application/vnd.gooddata.api+json",
     }
 
-    response = requests.get(url, headers=headers)
+    response = _get_http_session().get(url, headers=headers)
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
     attrs = data["data"]["attributes"]
     content = attrs.get("content", {})
@@ -1047,13 +1699,12 @@ def preview_update_metric(
         proposed_changes["tags"] = {"from": current_values["tags"], "to": tags}
 
     if not proposed_changes:
-        return json.dumps(
+        return _dump_json(
             {
                 "metric_id": metric_id,
                 "message": "No changes proposed. All provided values match current values.",
                 "current_values": current_values,
-            },
-            indent=2,
+            }
         )
 
     # Generate confirmation token
@@ -1085,7 +1736,7 @@ def preview_update_metric(
         ),
     }
 
-    return json.dumps(result, indent=2)
+    return _dump_json(result)
 
 
 @mcp.tool()
@@ -1122,8 +1773,6 @@ def apply_update_metric(
         - backup_path: Path to the backup file (for rollback if needed)
         - changes_applied: What was changed
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -1131,8 +1780,7 @@ def apply_update_metric(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Fetch current metric definition
     url = f"{host}/api/v1/entities/workspaces/{ws_id}/metrics/{metric_id}"
@@ -1142,9 +1790,9 @@ def apply_update_metric(
         "Content-Type": "application/vnd.gooddata.api+json",
     }
 
-    response = requests.get(url, headers=headers)
+    response = _get_http_session().get(url, headers=headers)
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
     attrs = data["data"]["attributes"]
     content = attrs.get("content", {})
@@ -1171,12 +1819,11 @@ def apply_update_metric(
         proposed_changes["tags"] = {"from": current_values["tags"], "to": tags}
 
     if not proposed_changes:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": "No changes to apply. All provided values match current values.",
-            },
-            indent=2,
+            }
         )
 
     # Verify confirmation token matches current state
@@ -1191,13 +1838,12 @@ def apply_update_metric(
             status="error",
             details={"reason": "token_mismatch"},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": "Invalid confirmation token. The metric may have changed since preview.",
                 "message": "Please run preview_update_metric again to get a new token.",
-            },
-            indent=2,
+            }
         )
 
     # Save backup BEFORE making any changes
@@ -1217,7 +1863,7 @@ def apply_update_metric(
 
     # Update the metric via PUT
     try:
-        response = requests.put(url, headers=headers, json=data)
+        response = _get_http_session().put(url, headers=headers, json=data)
         response.raise_for_status()
     except Exception as e:
         _log_audit(
@@ -1227,16 +1873,17 @@ def apply_update_metric(
             status="error",
             details={"error": str(e), "backup_path": str(backup_path)},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Failed to update metric: {e}",
                 "backup_path": str(backup_path),
                 "message": "Backup was saved. Use restore_metric_from_backup to restore if needed.",
-            },
-            indent=2,
+            }
         )
 
+    _invalidate_workspace_cache(ws_id)
+
     # Log successful change
     _log_audit(
         customer=customer_name,
@@ -1249,15 +1896,14 @@ def apply_update_metric(
         },
     )
 
-    return json.dumps(
+    return _dump_json(
         {
             "success": True,
             "metric_id": metric_id,
             "backup_path": str(backup_path),
             "changes_applied": proposed_changes,
             "message": f"Successfully updated metric '{metric_id}'. Backup saved.",
-        },
-        indent=2,
+        }
     )
 
 
@@ -1291,8 +1937,6 @@ def preview_create_metric(
         - confirmation_token: Token to pass to apply_create_metric
         - next_step: Instructions for applying the creation
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -1300,8 +1944,7 @@ def preview_create_metric(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Check if metric already exists
     url = f"{host}/api/v1/entities/workspaces/{ws_id}/metrics/{metric_id}"
@@ -1310,14 +1953,13 @@ def preview_create_metric(
         "Accept": "application/vnd.gooddata.api+json",
     }
 
-    response = requests.get(url, headers=headers)
+    response = _get_http_session().get(url, headers=headers)
     if response.status_code == 200:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Metric '{metric_id}' already exists. Use preview_update_metric instead.",
-            },
-            indent=2,
+            }
         )
 
     # Build the metric definition
@@ -1354,7 +1996,7 @@ def preview_create_metric(
         ),
     }
 
-    return json.dumps(result, indent=2)
+    return _dump_json(result)
 
 
 @mcp.tool()
@@ -1387,8 +2029,6 @@ def apply_create_metric(
         - success: Whether the operation succeeded
         - metric_id: The ID of the created metric
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -1396,8 +2036,7 @@ def apply_create_metric(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Build and verify the metric definition matches token
     metric_definition = {
@@ -1420,13 +2059,12 @@ def apply_create_metric(
             status="error",
             details={"reason": "token_mismatch"},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": "Invalid confirmation token. Parameters may have changed since preview.",
                 "message": "Please run preview_create_metric again to get a new token.",
-            },
-            indent=2,
+            }
         )
 
     # Build the API payload
@@ -1455,7 +2093,7 @@ def apply_create_metric(
     }
 
     try:
-        response = requests.post(url, headers=headers, json=payload)
+        response = _get_http_session().post(url, headers=headers, json=payload)
         response.raise_for_status()
     except Exception as e:
         _log_audit(
@@ -1465,14 +2103,15 @@ def apply_create_metric(
             status="error",
             details={"error": str(e)},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Failed to create metric: {e}",
-            },
-            indent=2,
+            }
         )
 
+    _invalidate_workspace_cache(ws_id)
+
     # Log successful creation
     _log_audit(
         customer=customer_name,
@@ -1482,14 +2121,13 @@ def apply_create_metric(
         details={"title": title, "maql": maql},
     )
 
-    return json.dumps(
+    return _dump_json(
         {
             "success": True,
             "metric_id": metric_id,
             "title": title,
             "message": f"Successfully created metric '{metric_id}'.",
-        },
-        indent=2,
+        }
     )
 
 
@@ -1513,8 +2151,6 @@ def preview_delete_metric(
         - confirmation_token: Token to pass to apply_delete_metric
         - next_step: Instructions for applying the deletion
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -1522,8 +2158,7 @@ def preview_delete_metric(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Fetch current metric definition
     url = f"{host}/api/v1/entities/workspaces/{ws_id}/metrics/{metric_id}"
@@ -1532,17 +2167,16 @@ def preview_delete_metric(
         "Accept": "application/vnd.gooddata.api+json",
     }
 
-    response = requests.get(url, headers=headers)
+    response = _get_http_session().get(url, headers=headers)
     if response.status_code == 404:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Metric '{metric_id}' not found.",
-            },
-            indent=2,
+            }
         )
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
     attrs = data["data"]["attributes"]
     content = attrs.get("content", {})
@@ -1581,7 +2215,7 @@ def preview_delete_metric(
         ),
     }
 
-    return json.dumps(result, indent=2)
+    return _dump_json(result)
 
 
 @mcp.tool()
@@ -1607,8 +2241,6 @@ def apply_delete_metric(
         - success: Whether the operation succeeded
         - backup_path: Path to the backup file (for recovery if needed)
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -1616,8 +2248,7 @@ def apply_delete_metric(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Fetch current metric to verify and backup
     url = f"{host}/api/v1/entities/workspaces/{ws_id}/metrics/{metric_id}"
@@ -1626,17 +2257,16 @@ def apply_delete_metric(
         "Accept": "application/vnd.gooddata.api+json",
     }
 
-    response = requests.get(url, headers=headers)
+    response = _get_http_session().get(url, headers=headers)
     if response.status_code == 404:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Metric '{metric_id}' not found.",
-            },
-            indent=2,
+            }
         )
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
     attrs = data["data"]["attributes"]
 
@@ -1652,13 +2282,12 @@ def apply_delete_metric(
             status="error",
             details={"reason": "token_mismatch"},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": "Invalid confirmation token. The metric may have changed since preview.",
                 "message": "Please run preview_delete_metric again to get a new token.",
-            },
-            indent=2,
+            }
         )
 
     # Save backup BEFORE deletion
@@ -1666,7 +2295,7 @@ def apply_delete_metric(
 
     # Delete the metric
     try:
-        response = requests.delete(url, headers=headers)
+        response = _get_http_session().delete(url, headers=headers)
         response.raise_for_status()
     except Exception as e:
         _log_audit(
@@ -1676,15 +2305,16 @@ def apply_delete_metric(
             status="error",
             details={"error": str(e), "backup_path": str(backup_path)},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Failed to delete metric: {e}",
                 "backup_path": str(backup_path),
-            },
-            indent=2,
+            }
         )
 
+    _invalidate_workspace_cache(ws_id)
+
     # Log successful deletion
     _log_audit(
         customer=customer_name,
@@ -1697,15 +2327,14 @@ def apply_delete_metric(
         },
     )
 
-    return json.dumps(
+    return _dump_json(
         {
             "success": True,
             "metric_id": metric_id,
             "title": attrs.get("title"),
             "backup_path": str(backup_path),
             "message": f"Successfully deleted metric '{metric_id}'. Backup saved for recovery.",
-        },
-        indent=2,
+        }
     )
 
 
@@ -1726,8 +2355,6 @@ def restore_metric_from_backup(
     Returns:
         JSON with success status and details.
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -1735,22 +2362,19 @@ def restore_metric_from_backup(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Load backup file
     backup_file = Path(backup_path)
     if not backup_file.exists():
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Backup file not found: {backup_path}",
-            },
-            indent=2,
+            }
         )
 
-    with open(backup_file) as f:
-        backup = json.load(f)
+    backup = _load_backup(backup_file)
 
     object_type = backup.get("object_type")
     object_id = backup.get("object_id")
@@ -1758,13 +2382,12 @@ def restore_metric_from_backup(
     backed_up_at = backup.get("backed_up_at")
 
     if object_type != "metric":
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"This function only restores metrics. Got: {object_type}",
                 "message": "Use restore_insight_from_backup for visualization objects.",
-            },
-            indent=2,
+            }
         )
 
     # Check if metric exists (update) or not (create)
@@ -1775,17 +2398,17 @@ def restore_metric_from_backup(
         "Content-Type": "application/vnd.gooddata.api+json",
     }
 
-    check_response = requests.get(url, headers=headers)
+    check_response = _get_http_session().get(url, headers=headers)
     metric_exists = check_response.status_code == 200
 
     try:
         if metric_exists:
             # Update existing metric
-            response = requests.put(url, headers=headers, json=data)
+            response = _get_http_session().put(url, headers=headers, json=data)
         else:
             # Create metric (was deleted)
             create_url = f"{host}/api/v1/entities/workspaces/{ws_id}/metrics"
-            response = requests.post(create_url, headers=headers, json=data)
+            response = _get_http_session().post(create_url, headers=headers, json=data)
         response.raise_for_status()
     except Exception as e:
         _log_audit(
@@ -1795,14 +2418,15 @@ def restore_metric_from_backup(
             status="error",
             details={"error": str(e), "backup_path": backup_path},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Failed to restore metric: {e}",
-            },
-            indent=2,
+            }
         )
 
+    _invalidate_workspace_cache(ws_id)
+
     # Log successful restore
     _log_audit(
         customer=customer_name,
@@ -1816,7 +2440,7 @@ def restore_metric_from_backup(
         },
     )
 
-    return json.dumps(
+    return _dump_json(
         {
             "success": True,
             "metric_id": object_id,
@@ -1824,8 +2448,7 @@ def restore_metric_from_backup(
             "restored_from": backup_path,
             "original_backup_time": backed_up_at,
             "message": "Successfully restored metric from backup.",
-        },
-        indent=2,
+        }
     )
 
 
@@ -1834,6 +2457,117 @@ def restore_metric_from_backup(
 # =============================================================================
 
 
+def _measures_bucket(buckets: list) -> dict | None:
+    """Return the insight's "measures" bucket (there is at most one), if any."""
+    return next((b for b in buckets if b.get("localIdentifier") == "measures"), None)
+
+
+def _scan_measures(buckets: list) -> tuple[list, list, dict]:
+    """Walk the measures bucket once and find repeated metrics.
+
+    Returns:
+        (current_metrics, duplicates, seen) where seen maps each metric ID to
+        the local identifier of its first occurrence.
+    """
+    current_metrics = []
+    duplicates = []
+    seen = {}
+
+    bucket = _measures_bucket(buckets)
+    if bucket is None:
+        return current_metrics, duplicates, seen
+
+    for item in bucket.get("items", []):
+        measure = item.get("measure")
+        if measure is None:
+            continue
+        metric_id = _measure_metric_id(measure)
+        local_id = measure.get("localIdentifier")
+        metric_title = measure.get("title")
+
+        current_metrics.append(
+            {"local_identifier": local_id, "metric_id": metric_id, "title": metric_title}
+        )
+        if metric_id in seen:
+            duplicates.append(
+                {
+                    "local_identifier": local_id,
+                    "metric_id": metric_id,
+                    "title": metric_title,
+                    "duplicate_of": seen[metric_id],
+                }
+            )
+        else:
+            seen[metric_id] = local_id
+
+    return current_metrics, duplicates, seen
+
+
+def _hash_duplicates(insight_id: str, duplicates: list) -> str:
+    """Build the confirmation token for a duplicate-metric removal.
+
+    Feeds sha256 one line per duplicate, in local-identifier order, instead of
+    encoding one large JSON string.
+    """
+    h = hashlib.sha256(insight_id.encode())
+    h.update(b":")
+    for d in sorted(duplicates, key=lambda d: d["local_identifier"] or ""):
+        h.update(f"{d['local_identifier']}|{d['metric_id']}|{d['duplicate_of']}\n".encode())
+    return h.hexdigest()[:16]
+
+
+# Seconds a previewed insight may be applied without re-fetching it
+_PREVIEW_TTL = 120.0
+
+# (ws_id, insight_id, confirmation_token) -> (cached_at, insight JSON, duplicates,
+# seen metric IDs, ETag)
+_preview_cache: dict[tuple[str, str, str], tuple[float, dict, list, dict, str]] = {}
+
+
+def _cache_preview(
+    ws_id: str,
+    insight_id: str,
+    confirmation_token: str,
+    data: dict,
+    duplicates: list,
+    seen: dict,
+    etag: str,
+) -> None:
+    """Remember a previewed insight so the matching apply can skip its GET."""
+    now = time.monotonic()
+    for key in [k for k, v in _preview_cache.items() if now - v[0] >= _PREVIEW_TTL]:
+        del _preview_cache[key]
+    _preview_cache[(ws_id, insight_id, confirmation_token)] = (now, data, duplicates, seen, etag)
+
+
+def _pop_preview(
+    ws_id: str, insight_id: str, confirmation_token: str
+) -> tuple[dict, list, dict, str] | None:
+    """Take a still-fresh cached preview of this insight for this token, if any."""
+    cached = _preview_cache.pop((ws_id, insight_id, confirmation_token), None)
+    if cached is None or time.monotonic() - cached[0] >= _PREVIEW_TTL:
+        return None
+    return cached[1:]
+
+
+def _duplicate_token_mismatch(customer_name: str, insight_id: str) -> str:
+    """Audit and report an apply whose insight no longer matches its preview."""
+    _log_audit(
+        customer=customer_name,
+        operation="apply_remove_duplicate_metrics",
+        object_id=insight_id,
+        status="error",
+        details={"reason": "token_mismatch"},
+    )
+    return _dump_json(
+        {
+            "success": False,
+            "error": "Invalid confirmation token. The insight may have changed since preview.",
+            "message": "Please run preview_remove_duplicate_metrics again to get a new token.",
+        }
+    )
+
+
 @mcp.tool()
 def preview_remove_duplicate_metrics(
     insight_id: str,
@@ -1855,8 +2589,6 @@ def preview_remove_duplicate_metrics(
         - confirmation_token: Token to pass to apply_remove_duplicate_metrics
         - next_step: Instructions for applying the change
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -1864,8 +2596,7 @@ def preview_remove_duplicate_metrics(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Fetch current insight definition
     url = f"{host}/api/v1/entities/workspaces/{ws_id}/visualizationObjects/{insight_id}"
@@ -1874,52 +2605,26 @@ def preview_remove_duplicate_metrics(
         "Accept": "application/vnd.gooddata.api+json",
     }
 
-    response = requests.get(url, headers=headers)
+    response = _get_http_session().get(url, headers=headers)
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
     title = data["data"]["attributes"].get("title", "")
     content = data["data"]["attributes"]["content"]
     buckets = content.get("buckets", [])
 
     # Find metrics bucket and identify duplicates
-    current_metrics = []
-    duplicates = []
-    seen_metric_ids = {}
-
-    for bucket in buckets:
-        if bucket.get("localIdentifier") == "measures":
-            for item in bucket.get("items", []):
-                if "measure" in item:
-                    measure = item["measure"]
-                    metric_def = measure.get("definition", {}).get("measureDefinition", {})
-                    metric_id = metric_def.get("item", {}).get("identifier", {}).get("id")
-                    local_id = measure.get("localIdentifier")
-                    metric_title = measure.get("title")
-
-                    current_metrics.append(
-                        {
-                            "local_identifier": local_id,
-                            "metric_id": metric_id,
-                            "title": metric_title,
-                        }
-                    )
-
-                    if metric_id in seen_metric_ids:
-                        duplicates.append(
-                            {
-                                "local_identifier": local_id,
-                                "metric_id": metric_id,
-                                "title": metric_title,
-                                "duplicate_of": seen_metric_ids[metric_id],
-                            }
-                        )
-                    else:
-                        seen_metric_ids[metric_id] = local_id
+    current_metrics, duplicates, seen_metric_ids = _scan_measures(buckets)
 
     # Generate confirmation token (hash of insight_id + duplicates)
-    token_data = f"{insight_id}:{json.dumps(duplicates, sort_keys=True)}"
-    confirmation_token = hashlib.sha256(token_data.encode()).hexdigest()[:16]
+    confirmation_token = _hash_duplicates(insight_id, duplicates)
+
+    # Only cache when the server gave us an ETag, so apply can PUT with If-Match
+    etag = response.headers.get("ETag")
+    if duplicates and etag:
+        _cache_preview(
+            ws_id, insight_id, confirmation_token, data, duplicates, seen_metric_ids, etag
+        )
 
     # Log the preview action
     _log_audit(
@@ -1950,7 +2655,7 @@ def preview_remove_duplicate_metrics(
     else:
         result["message"] = "No duplicate metrics found. No action needed."
 
-    return json.dumps(result, indent=2)
+    return _dump_json(result)
 
 
 @mcp.tool()
@@ -1979,8 +2684,6 @@ def apply_remove_duplicate_metrics(
         - removed_duplicates: List of removed duplicate metrics
         - new_metric_count: Number of metrics after removal
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -1988,8 +2691,7 @@ def apply_remove_duplicate_metrics(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Fetch current insight definition
     url = f"{host}/api/v1/entities/workspaces/{ws_id}/visualizationObjects/{insight_id}"
@@ -1999,67 +2701,40 @@ def apply_remove_duplicate_metrics(
         "Content-Type": "application/vnd.gooddata.api+json",
     }
 
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    data = response.json()
+    # A fresh preview of this insight with this exact token lets us skip the
+    # GET. Either way the PUT carries the ETag the insight was read with, so the
+    # server rejects it (412) if someone else changed the insight in between.
+    cached = _pop_preview(ws_id, insight_id, confirmation_token)
+    if cached is not None:
+        data, duplicates, seen_metric_ids, etag = cached
+        buckets = data["data"]["attributes"]["content"].get("buckets", [])
+    else:
+        response = _get_http_session().get(url, headers=headers)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        etag = response.headers.get("ETag")
 
-    content = data["data"]["attributes"]["content"]
-    buckets = content.get("buckets", [])
+        content = data["data"]["attributes"]["content"]
+        buckets = content.get("buckets", [])
 
-    # Re-identify duplicates
-    duplicates = []
-    seen_metric_ids = {}
-
-    for bucket in buckets:
-        if bucket.get("localIdentifier") == "measures":
-            for item in bucket.get("items", []):
-                if "measure" in item:
-                    measure = item["measure"]
-                    metric_def = measure.get("definition", {}).get("measureDefinition", {})
-                    metric_id = metric_def.get("item", {}).get("identifier", {}).get("id")
-                    local_id = measure.get("localIdentifier")
-                    metric_title = measure.get("title")
-
-                    if metric_id in seen_metric_ids:
-                        duplicates.append(
-                            {
-                                "local_identifier": local_id,
-                                "metric_id": metric_id,
-                                "title": metric_title,
-                                "duplicate_of": seen_metric_ids[metric_id],
-                            }
-                        )
-                    else:
-                        seen_metric_ids[metric_id] = local_id
+        # Re-identify duplicates
+        _, duplicates, seen_metric_ids = _scan_measures(buckets)
 
-    # Verify confirmation token matches current state
-    token_data = f"{insight_id}:{json.dumps(duplicates, sort_keys=True)}"
-    expected_token = hashlib.sha256(token_data.encode()).hexdigest()[:16]
+        # Verify confirmation token matches current state
+        expected_token = _hash_duplicates(insight_id, duplicates)
 
-    if confirmation_token != expected_token:
-        _log_audit(
-            customer=customer_name,
-            operation="apply_remove_duplicate_metrics",
-            object_id=insight_id,
-            status="error",
-            details={"reason": "token_mismatch"},
-        )
-        return json.dumps(
-            {
-                "success": False,
-                "error": "Invalid confirmation token. The insight may have changed since preview.",
-                "message": "Please run preview_remove_duplicate_metrics again to get a new token.",
-            },
-            indent=2,
-        )
+        if confirmation_token != expected_token:
+            return _duplicate_token_mismatch(customer_name, insight_id)
+
+    if etag:
+        headers["If-Match"] = etag
 
     if not duplicates:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": "No duplicate metrics found to remove.",
-            },
-            indent=2,
+            }
         )
 
     # Save backup BEFORE making any changes
@@ -2068,17 +2743,19 @@ def apply_remove_duplicate_metrics(
     # Remove duplicates from the measures bucket
     duplicate_local_ids = {d["local_identifier"] for d in duplicates}
 
-    for bucket in buckets:
-        if bucket.get("localIdentifier") == "measures":
-            bucket["items"] = [
-                item
-                for item in bucket.get("items", [])
-                if item.get("measure", {}).get("localIdentifier") not in duplicate_local_ids
-            ]
+    # Duplicates were found, so the measures bucket exists
+    bucket = _measures_bucket(buckets)
+    bucket["items"] = [
+        item
+        for item in bucket.get("items", [])
+        if (item.get("measure") or {}).get("localIdentifier") not in duplicate_local_ids
+    ]
 
     # Update the insight via PUT
     try:
-        response = requests.put(url, headers=headers, json=data)
+        response = _get_http_session().put(url, headers=headers, json=data)
+        if response.status_code == 412:
+            return _duplicate_token_mismatch(customer_name, insight_id)
         response.raise_for_status()
     except Exception as e:
         _log_audit(
@@ -2088,16 +2765,17 @@ def apply_remove_duplicate_metrics(
             status="error",
             details={"error": str(e), "backup_path": str(backup_path)},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Failed to update insight: {e}",
                 "backup_path": str(backup_path),
                 "message": "Backup was saved. Use restore_insight_from_backup to restore if needed.",
-            },
-            indent=2,
+            }
         )
 
+    _invalidate_workspace_cache(ws_id)
+
     # Log successful change
     _log_audit(
         customer=customer_name,
@@ -2111,7 +2789,7 @@ def apply_remove_duplicate_metrics(
         },
     )
 
-    return json.dumps(
+    return _dump_json(
         {
             "success": True,
             "insight_id": insight_id,
@@ -2120,8 +2798,7 @@ def apply_remove_duplicate_metrics(
             "removed_count": len(duplicates),
             "new_metric_count": len(seen_metric_ids),
             "message": f"Successfully removed {len(duplicates)} duplicate metric(s). Backup saved.",
-        },
-        indent=2,
+        }
     )
 
 
@@ -2142,8 +2819,6 @@ def restore_insight_from_backup(
     Returns:
         JSON with success status and details.
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -2151,22 +2826,19 @@ def restore_insight_from_backup(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Load backup file
     backup_file = Path(backup_path)
     if not backup_file.exists():
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Backup file not found: {backup_path}",
-            },
-            indent=2,
+            }
         )
 
-    with open(backup_file) as f:
-        backup = json.load(f)
+    backup = _load_backup(backup_file)
 
     object_type = backup.get("object_type")
     object_id = backup.get("object_id")
@@ -2174,13 +2846,12 @@ def restore_insight_from_backup(
     backed_up_at = backup.get("backed_up_at")
 
     if object_type != "visualizationObject":
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Unsupported object type for restore: {object_type}",
                 "message": "Currently only visualizationObject restores are supported.",
-            },
-            indent=2,
+            }
         )
 
     # Restore the object via PUT
@@ -2192,7 +2863,7 @@ def restore_insight_from_backup(
     }
 
     try:
-        response = requests.put(url, headers=headers, json=data)
+        response = _get_http_session().put(url, headers=headers, json=data)
         response.raise_for_status()
     except Exception as e:
         _log_audit(
@@ -2202,14 +2873,15 @@ def restore_insight_from_backup(
             status="error",
             details={"error": str(e), "backup_path": backup_path},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Failed to restore insight: {e}",
-            },
-            indent=2,
+            }
         )
 
+    _invalidate_workspace_cache(ws_id)
+
     # Log successful restore
     _log_audit(
         customer=customer_name,
@@ -2222,7 +2894,7 @@ def restore_insight_from_backup(
         },
     )
 
-    return json.dumps(
+    return _dump_json(
         {
             "success": True,
             "object_id": object_id,
@@ -2230,8 +2902,7 @@ def restore_insight_from_backup(
             "restored_from": backup_path,
             "original_backup_time": backed_up_at,
             "message": f"Successfully restored {object_type} from backup.",
-        },
-        indent=2,
+        }
     )
 
 
@@ -2272,12 +2943,11 @@ def list_visualization_types() -> str:
 
     Returns a JSON object mapping simple type names to their GoodData visualizationUrl values.
     """
-    return json.dumps(
+    return _dump_json(
         {
             "visualization_types": VISUALIZATION_TYPES,
             "usage": "Use the simple name (e.g., 'table', 'bar') when creating insights.",
-        },
-        indent=2,
+        }
     )
 
 
@@ -2287,9 +2957,13 @@ def _validate_metrics_exist(ws_id: str, metric_ids: list[str], sdk) -> tuple[boo
     Returns:
         Tuple of (all_valid, missing_ids)
     """
-    catalog = sdk.catalog_workspace_content.get_full_catalog(ws_id)
-    existing_metrics = {m.id for m in catalog.metrics}
-    missing = [m for m in metric_ids if m not in existing_metrics]
+    # A cached catalog may predate objects created elsewhere, so re-check misses fresh
+    for max_age in (_CACHE_TTL, 0):
+        catalog = _get_full_catalog(sdk, ws_id, max_age)
+        existing_metrics = {m.id for m in catalog.metrics}
+        missing = [m for m in metric_ids if m not in existing_metrics]
+        if not missing:
+            break
     return len(missing) == 0, missing
 
 
@@ -2299,14 +2973,17 @@ def _validate_labels_exist(ws_id: str, label_ids: list[str], sdk) -> tuple[bool,
     Returns:
         Tuple of (all_valid, missing_ids)
     """
-    # Get all labels from datasets
-    catalog = sdk.catalog_workspace_content.get_full_catalog(ws_id)
-    existing_labels = set()
-    for dataset in catalog.datasets:
-        for attr in dataset.attributes:
-            for label in attr.labels:
-                existing_labels.add(label.id)
-    missing = [label_id for label_id in label_ids if label_id not in existing_labels]
+    # Get all labels from datasets, re-checking misses against a fresh catalog
+    for max_age in (_CACHE_TTL, 0):
+        catalog = _get_full_catalog(sdk, ws_id, max_age)
+        existing_labels = set()
+        for dataset in catalog.datasets:
+            for attr in dataset.attributes:
+                for label in attr.labels:
+                    existing_labels.add(label.id)
+        missing = [label_id for label_id in label_ids if label_id not in existing_labels]
+        if not missing:
+            break
     return len(missing) == 0, missing
 
 
@@ -2316,9 +2993,12 @@ def _validate_insights_exist(ws_id: str, insight_ids: list[str], sdk) -> tuple[b
     Returns:
         Tuple of (all_valid, missing_ids)
     """
-    am = sdk.catalog_workspace_content.get_declarative_analytics_model(ws_id)
-    existing_insights = {viz.id for viz in am.analytics.visualization_objects}
-    missing = [i for i in insight_ids if i not in existing_insights]
+    # Insights created outside this process may postdate the cached model
+    for max_age in (_CACHE_TTL, 0):
+        existing_insights = _get_analytics_model(sdk, ws_id, max_age).viz_by_id
+        missing = [i for i in insight_ids if i not in existing_insights]
+        if not missing:
+            break
     return len(missing) == 0, missing
 
 
@@ -2384,19 +3064,17 @@ def _get_dashboard_by_id(host: str, token: str, ws_id: str, dashboard_id: str) -
     Returns:
         Full API response data, or None if not found.
     """
-    import requests
-
     url = f"{host}/api/v1/entities/workspaces/{ws_id}/analyticalDashboards/{dashboard_id}"
     headers = {
         "Authorization": f"Bearer {token}",
         "Accept": "application/vnd.gooddata.api+json",
     }
 
-    response = requests.get(url, headers=headers)
+    response = _get_http_session().get(url, headers=headers)
     if response.status_code == 404:
         return None
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
 
 
 def _build_insight_content(
@@ -2416,8 +3094,6 @@ def _build_insight_content(
     Returns:
         The content dict for the visualization object
     """
-    import uuid
-
     # Build measures bucket
     measures_items = []
     for metric_id in metric_ids:
@@ -2498,8 +3174,6 @@ def preview_create_insight(
         - confirmation_token: Token to pass to apply_create_insight
         - next_step: Instructions for applying the creation
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -2507,19 +3181,17 @@ def preview_create_insight(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
     sdk = _get_sdk()
 
     # Validate visualization type
     if visualization_type.lower() not in VISUALIZATION_TYPES:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Invalid visualization type: '{visualization_type}'",
                 "valid_types": list(VISUALIZATION_TYPES.keys()),
-            },
-            indent=2,
+            }
         )
 
     # Check if insight already exists
@@ -2529,39 +3201,36 @@ def preview_create_insight(
         "Accept": "application/vnd.gooddata.api+json",
     }
 
-    response = requests.get(url, headers=headers)
+    response = _get_http_session().get(url, headers=headers)
     if response.status_code == 200:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Insight '{insight_id}' already exists. Use preview_update_insight instead.",
-            },
-            indent=2,
+            }
         )
 
     # Validate metrics exist
     metrics_valid, missing_metrics = _validate_metrics_exist(ws_id, metric_ids, sdk)
     if not metrics_valid:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": "Some metrics do not exist in the workspace.",
                 "missing_metrics": missing_metrics,
-            },
-            indent=2,
+            }
         )
 
     # Validate attributes/labels exist
     if attribute_ids:
         labels_valid, missing_labels = _validate_labels_exist(ws_id, attribute_ids, sdk)
         if not labels_valid:
-            return json.dumps(
+            return _dump_json(
                 {
                     "success": False,
                     "error": "Some labels/attributes do not exist in the workspace.",
                     "missing_labels": missing_labels,
-                },
-                indent=2,
+                }
             )
 
     # Build the insight definition for preview
@@ -2605,7 +3274,7 @@ def preview_create_insight(
         ),
     }
 
-    return json.dumps(result, indent=2)
+    return _dump_json(result)
 
 
 @mcp.tool()
@@ -2640,8 +3309,6 @@ def apply_create_insight(
         - success: Whether the operation succeeded
         - insight_id: The ID of the created insight
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -2649,8 +3316,7 @@ def apply_create_insight(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Build and verify the insight definition matches token
     insight_definition = {
@@ -2674,13 +3340,12 @@ def apply_create_insight(
             status="error",
             details={"reason": "token_mismatch"},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": "Invalid confirmation token. Parameters may have changed since preview.",
                 "message": "Please run preview_create_insight again to get a new token.",
-            },
-            indent=2,
+            }
         )
 
     # Build the content
@@ -2708,7 +3373,7 @@ def apply_create_insight(
     }
 
     try:
-        response = requests.post(url, headers=headers, json=payload)
+        response = _get_http_session().post(url, headers=headers, json=payload)
         response.raise_for_status()
     except Exception as e:
         _log_audit(
@@ -2718,14 +3383,15 @@ def apply_create_insight(
             status="error",
             details={"error": str(e)},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Failed to create insight: {e}",
-            },
-            indent=2,
+            }
         )
 
+    _invalidate_workspace_cache(ws_id)
+
     # Log successful creation
     _log_audit(
         customer=customer_name,
@@ -2735,15 +3401,14 @@ def apply_create_insight(
         details={"title": title, "visualization_type": visualization_type},
     )
 
-    return json.dumps(
+    return _dump_json(
         {
             "success": True,
             "insight_id": insight_id,
             "title": title,
             "visualization_type": visualization_type,
             "message": f"Successfully created insight '{title}'.",
-        },
-        indent=2,
+        }
     )
 
 
@@ -2778,8 +3443,6 @@ def preview_update_insight(
         - confirmation_token: Token to pass to apply_update_insight
         - backup_path: Path to the backup file
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -2787,8 +3450,7 @@ def preview_update_insight(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
     sdk = _get_sdk()
 
     # Fetch current insight
@@ -2798,17 +3460,16 @@ def preview_update_insight(
         "Accept": "application/vnd.gooddata.api+json",
     }
 
-    response = requests.get(url, headers=headers)
+    response = _get_http_session().get(url, headers=headers)
     if response.status_code == 404:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Insight '{insight_id}' not found. Use preview_create_insight to create a new one.",
-            },
-            indent=2,
+            }
         )
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
     # Create backup
     backup_path = _save_backup(customer_name, "visualizationObject", insight_id, data)
@@ -2833,13 +3494,12 @@ def preview_update_insight(
         current_viz = current_state["visualization_type"]
         if visualization_type.lower() != current_viz:
             if visualization_type.lower() not in VISUALIZATION_TYPES:
-                return json.dumps(
+                return _dump_json(
                     {
                         "success": False,
                         "error": f"Invalid visualization type: '{visualization_type}'",
                         "valid_types": list(VISUALIZATION_TYPES.keys()),
-                    },
-                    indent=2,
+                    }
                 )
             changes["visualization_type"] = {"from": current_viz, "to": visualization_type}
 
@@ -2847,13 +3507,12 @@ def preview_update_insight(
     if metric_ids is not None:
         metrics_valid, missing_metrics = _validate_metrics_exist(ws_id, metric_ids, sdk)
         if not metrics_valid:
-            return json.dumps(
+            return _dump_json(
                 {
                     "success": False,
                     "error": "Some metrics do not exist in the workspace.",
                     "missing_metrics": missing_metrics,
-                },
-                indent=2,
+                }
             )
         changes["metric_ids"] = {"to": metric_ids}
 
@@ -2861,24 +3520,22 @@ def preview_update_insight(
     if attribute_ids is not None:
         labels_valid, missing_labels = _validate_labels_exist(ws_id, attribute_ids, sdk)
         if not labels_valid:
-            return json.dumps(
+            return _dump_json(
                 {
                     "success": False,
                     "error": "Some labels/attributes do not exist in the workspace.",
                     "missing_labels": missing_labels,
-                },
-                indent=2,
+                }
             )
         changes["attribute_ids"] = {"to": attribute_ids}
 
     if not changes:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": True,
                 "message": "No changes specified.",
                 "current": current_state,
-            },
-            indent=2,
+            }
         )
 
     # Generate confirmation token
@@ -2913,7 +3570,7 @@ def preview_update_insight(
         ),
     }
 
-    return json.dumps(result, indent=2)
+    return _dump_json(result)
 
 
 @mcp.tool()
@@ -2947,8 +3604,6 @@ def apply_update_insight(
         - success: Whether the operation succeeded
         - insight_id: The ID of the updated insight
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -2956,8 +3611,7 @@ def apply_update_insight(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Fetch current insight
     url = f"{host}/api/v1/entities/workspaces/{ws_id}/visualizationObjects/{insight_id}"
@@ -2966,17 +3620,16 @@ def apply_update_insight(
         "Accept": "application/vnd.gooddata.api+json",
     }
 
-    response = requests.get(url, headers=headers)
+    response = _get_http_session().get(url, headers=headers)
     if response.status_code == 404:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Insight '{insight_id}' not found.",
-            },
-            indent=2,
+            }
         )
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
     current_attrs = data["data"]["attributes"]
     current_content = current_attrs.get("content", {})
@@ -3018,13 +3671,12 @@ def apply_update_insight(
             status="error",
             details={"reason": "token_mismatch"},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": "Invalid confirmation token. The insight may have changed since preview.",
                 "message": "Please run preview_update_insight again to get a new token.",
-            },
-            indent=2,
+            }
         )
 
     # Apply changes to the data
@@ -3047,10 +3699,7 @@ def apply_update_insight(
                 if bucket.get("localIdentifier") == "measures":
                     for item in bucket.get("items", []):
                         if "measure" in item:
-                            metric_def = (
-                                item["measure"].get("definition", {}).get("measureDefinition", {})
-                            )
-                            metric_id = metric_def.get("item", {}).get("identifier", {}).get("id")
+                            metric_id = _measure_metric_id(item["measure"])
                             if metric_id:
                                 new_metric_ids.append(metric_id)
 
@@ -3077,7 +3726,7 @@ def apply_update_insight(
     # Update via PUT
     headers["Content-Type"] = "application/vnd.gooddata.api+json"
     try:
-        response = requests.put(url, headers=headers, json=data)
+        response = _get_http_session().put(url, headers=headers, json=data)
         response.raise_for_status()
     except Exception as e:
         _log_audit(
@@ -3087,15 +3736,16 @@ def apply_update_insight(
             status="error",
             details={"error": str(e)},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Failed to update insight: {e}",
                 "message": "Backup was saved during preview. Use restore_insight_from_backup to restore if needed.",
-            },
-            indent=2,
+            }
         )
 
+    _invalidate_workspace_cache(ws_id)
+
     # Log successful update
     _log_audit(
         customer=customer_name,
@@ -3105,14 +3755,13 @@ def apply_update_insight(
         details={"changes": list(changes.keys())},
     )
 
-    return json.dumps(
+    return _dump_json(
         {
             "success": True,
             "insight_id": insight_id,
             "changes_applied": list(changes.keys()),
             "message": f"Successfully updated insight '{insight_id}'.",
-        },
-        indent=2,
+        }
     )
 
 
@@ -3137,8 +3786,6 @@ def preview_delete_insight(
         - backup_path: Path to the backup file
         - warning: Deletion warning message
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -3146,8 +3793,7 @@ def preview_delete_insight(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Fetch current insight
     url = f"{host}/api/v1/entities/workspaces/{ws_id}/visualizationObjects/{insight_id}"
@@ -3156,17 +3802,16 @@ def preview_delete_insight(
         "Accept": "application/vnd.gooddata.api+json",
     }
 
-    response = requests.get(url, headers=headers)
+    response = _get_http_session().get(url, headers=headers)
     if response.status_code == 404:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Insight '{insight_id}' not found.",
-            },
-            indent=2,
+            }
         )
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
     # Create backup
     backup_path = _save_backup(customer_name, "visualizationObject", insight_id, data)
@@ -3208,7 +3853,7 @@ def preview_delete_insight(
         ),
     }
 
-    return json.dumps(result, indent=2)
+    return _dump_json(result)
 
 
 @mcp.tool()
@@ -3233,8 +3878,6 @@ def apply_delete_insight(
         - deleted_insight_id: The ID of the deleted insight
         - backup_path: Path to the backup for potential restore
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -3242,8 +3885,7 @@ def apply_delete_insight(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Fetch current insight to verify token
     url = f"{host}/api/v1/entities/workspaces/{ws_id}/visualizationObjects/{insight_id}"
@@ -3252,17 +3894,16 @@ def apply_delete_insight(
         "Accept": "application/vnd.gooddata.api+json",
     }
 
-    response = requests.get(url, headers=headers)
+    response = _get_http_session().get(url, headers=headers)
     if response.status_code == 404:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Insight '{insight_id}' not found.",
-            },
-            indent=2,
+            }
         )
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
     title = data["data"]["attributes"].get("title", "")
 
@@ -3278,25 +3919,24 @@ def apply_delete_insight(
             status="error",
             details={"reason": "token_mismatch"},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": "Invalid confirmation token. The insight may have changed since preview.",
                 "message": "Please run preview_delete_insight again to get a new token.",
-            },
-            indent=2,
+            }
         )
 
     # Find the backup path for reference
     backup_dir = _get_backup_dir(customer_name)
     backup_files = sorted(
-        backup_dir.glob(f"visualizationObject_{insight_id[:8]}_*.json"), reverse=True
+        backup_dir.glob(f"visualizationObject_{insight_id[:8]}_*.json*"), reverse=True
     )
     backup_path = str(backup_files[0]) if backup_files else "unknown"
 
     # Delete via DELETE
     try:
-        response = requests.delete(url, headers=headers)
+        response = _get_http_session().delete(url, headers=headers)
         response.raise_for_status()
     except Exception as e:
         _log_audit(
@@ -3306,14 +3946,15 @@ def apply_delete_insight(
             status="error",
             details={"error": str(e)},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Failed to delete insight: {e}",
-            },
-            indent=2,
+            }
         )
 
+    _invalidate_workspace_cache(ws_id)
+
     # Log successful deletion
     _log_audit(
         customer=customer_name,
@@ -3323,7 +3964,7 @@ def apply_delete_insight(
         details={"title": title, "backup_path": backup_path},
     )
 
-    return json.dumps(
+    return _dump_json(
         {
             "success": True,
             "deleted_insight_id": insight_id,
@@ -3331,8 +3972,7 @@ def apply_delete_insight(
             "backup_path": backup_path,
             "message": f"Successfully deleted insight '{title}'.",
             "restore_info": f"To restore, call: restore_insight_from_backup(backup_path='{backup_path}', customer='{customer_name}')",
-        },
-        indent=2,
+        }
     )
 
 
@@ -3376,42 +4016,38 @@ def preview_create_dashboard(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
     sdk = _get_sdk()
 
     # Validate columns
     if columns < 1 or columns > 4:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Invalid columns value: {columns}. Must be 1-4.",
-            },
-            indent=2,
+            }
         )
 
     # Check if dashboard already exists
     existing = _get_dashboard_by_id(host, token, ws_id, dashboard_id)
     if existing is not None:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Dashboard '{dashboard_id}' already exists. Use preview_update_dashboard instead.",
-            },
-            indent=2,
+            }
         )
 
     # Validate insights exist (can be empty for dashboard with no initial insights)
     if insight_ids:
         insights_valid, missing_insights = _validate_insights_exist(ws_id, insight_ids, sdk)
         if not insights_valid:
-            return json.dumps(
+            return _dump_json(
                 {
                     "success": False,
                     "error": "Some insights do not exist in the workspace.",
                     "missing_insights": missing_insights,
-                },
-                indent=2,
+                }
             )
 
     # Build dashboard content
@@ -3456,7 +4092,7 @@ def preview_create_dashboard(
         ),
     }
 
-    return json.dumps(result, indent=2)
+    return _dump_json(result)
 
 
 @mcp.tool()
@@ -3487,8 +4123,6 @@ def apply_create_dashboard(
     Returns:
         JSON with success status and dashboard_id.
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -3496,8 +4130,7 @@ def apply_create_dashboard(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Build and verify the definition matches token
     dashboard_definition = {
@@ -3522,13 +4155,12 @@ def apply_create_dashboard(
             status="error",
             details={"reason": "token_mismatch"},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": "Invalid confirmation token. Parameters may have changed since preview.",
                 "message": "Please run preview_create_dashboard again to get a new token.",
-            },
-            indent=2,
+            }
         )
 
     # Build the dashboard content
@@ -3556,7 +4188,7 @@ def apply_create_dashboard(
     }
 
     try:
-        response = requests.post(url, headers=headers, json=payload)
+        response = _get_http_session().post(url, headers=headers, json=payload)
         response.raise_for_status()
     except Exception as e:
         _log_audit(
@@ -3566,14 +4198,15 @@ def apply_create_dashboard(
             status="error",
             details={"error": str(e)},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Failed to create dashboard: {e}",
-            },
-            indent=2,
+            }
         )
 
+    _invalidate_workspace_cache(ws_id)
+
     # Log successful creation
     _log_audit(
         customer=customer_name,
@@ -3583,15 +4216,14 @@ def apply_create_dashboard(
         details={"title": title, "insight_count": len(insight_ids)},
     )
 
-    return json.dumps(
+    return _dump_json(
         {
             "success": True,
             "dashboard_id": dashboard_id,
             "title": title,
             "insight_count": len(insight_ids),
             "message": f"Successfully created dashboard '{title}'.",
-        },
-        indent=2,
+        }
     )
 
 
@@ -3630,19 +4262,17 @@ def preview_update_dashboard(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
     sdk = _get_sdk()
 
     # Fetch current dashboard
     data = _get_dashboard_by_id(host, token, ws_id, dashboard_id)
     if data is None:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Dashboard '{dashboard_id}' not found. Use preview_create_dashboard to create a new one.",
-            },
-            indent=2,
+            }
         )
 
     # Create backup
@@ -3698,24 +4328,22 @@ def preview_update_dashboard(
                 ws_id, insights_to_validate, sdk
             )
             if not insights_valid:
-                return json.dumps(
+                return _dump_json(
                     {
                         "success": False,
                         "error": "Some insights do not exist in the workspace.",
                         "missing_insights": missing_insights,
-                    },
-                    indent=2,
+                    }
                 )
         changes["insight_ids"] = {"from": current_insight_ids, "to": new_insight_ids}
 
     if not changes:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": True,
                 "message": "No changes specified.",
                 "current": current_state,
-            },
-            indent=2,
+            }
         )
 
     # Generate confirmation token
@@ -3750,7 +4378,7 @@ def preview_update_dashboard(
         ),
     }
 
-    return json.dumps(result, indent=2)
+    return _dump_json(result)
 
 
 @mcp.tool()
@@ -3782,8 +4410,6 @@ def apply_update_dashboard(
     Returns:
         JSON with success status and changes applied.
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -3791,18 +4417,16 @@ def apply_update_dashboard(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Fetch current dashboard
     data = _get_dashboard_by_id(host, token, ws_id, dashboard_id)
     if data is None:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Dashboard '{dashboard_id}' not found.",
-            },
-            indent=2,
+            }
         )
 
     current_attrs = data["data"]["attributes"]
@@ -3864,13 +4488,12 @@ def apply_update_dashboard(
             status="error",
             details={"reason": "token_mismatch"},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": "Invalid confirmation token. The dashboard may have changed since preview.",
                 "message": "Please run preview_update_dashboard again to get a new token.",
-            },
-            indent=2,
+            }
         )
 
     # Apply changes
@@ -3897,7 +4520,7 @@ def apply_update_dashboard(
     }
 
     try:
-        response = requests.put(url, headers=headers, json=data)
+        response = _get_http_session().put(url, headers=headers, json=data)
         response.raise_for_status()
     except Exception as e:
         _log_audit(
@@ -3907,15 +4530,16 @@ def apply_update_dashboard(
             status="error",
             details={"error": str(e)},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Failed to update dashboard: {e}",
                 "message": "Backup was saved during preview. Use restore_dashboard_from_backup to restore if needed.",
-            },
-            indent=2,
+            }
         )
 
+    _invalidate_workspace_cache(ws_id)
+
     # Log successful update
     _log_audit(
         customer=customer_name,
@@ -3925,14 +4549,13 @@ def apply_update_dashboard(
         details={"changes": list(changes.keys())},
     )
 
-    return json.dumps(
+    return _dump_json(
         {
             "success": True,
             "dashboard_id": dashboard_id,
             "changes_applied": list(changes.keys()),
             "message": f"Successfully updated dashboard '{dashboard_id}'.",
-        },
-        indent=2,
+        }
     )
 
 
@@ -3960,18 +4583,16 @@ def preview_delete_dashboard(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Fetch current dashboard
     data = _get_dashboard_by_id(host, token, ws_id, dashboard_id)
     if data is None:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Dashboard '{dashboard_id}' not found.",
-            },
-            indent=2,
+            }
         )
 
     # Create backup
@@ -4014,7 +4635,7 @@ def preview_delete_dashboard(
         ),
     }
 
-    return json.dumps(result, indent=2)
+    return _dump_json(result)
 
 
 @mcp.tool()
@@ -4036,8 +4657,6 @@ def apply_delete_dashboard(
     Returns:
         JSON with success status, deleted_dashboard_id, backup_path.
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -4045,18 +4664,16 @@ def apply_delete_dashboard(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Fetch current dashboard to verify token
     data = _get_dashboard_by_id(host, token, ws_id, dashboard_id)
     if data is None:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Dashboard '{dashboard_id}' not found.",
-            },
-            indent=2,
+            }
         )
 
     dashboard_title = data["data"]["attributes"].get("title", "")
@@ -4073,18 +4690,17 @@ def apply_delete_dashboard(
             status="error",
             details={"reason": "token_mismatch"},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": "Invalid confirmation token. The dashboard may have changed since preview.",
                 "message": "Please run preview_delete_dashboard again to get a new token.",
-            },
-            indent=2,
+            }
         )
 
     # Find backup path
     backup_dir = _get_backup_dir(customer_name)
-    backup_files = sorted(backup_dir.glob(f"analyticalDashboard_{dashboard_id[:8]}_*.json"))
+    backup_files = sorted(backup_dir.glob(f"analyticalDashboard_{dashboard_id[:8]}_*.json*"))
     backup_path = str(backup_files[-1]) if backup_files else "unknown"
 
     # Delete via DELETE
@@ -4095,7 +4711,7 @@ def apply_delete_dashboard(
     }
 
     try:
-        response = requests.delete(url, headers=headers)
+        response = _get_http_session().delete(url, headers=headers)
         response.raise_for_status()
     except Exception as e:
         _log_audit(
@@ -4105,14 +4721,15 @@ def apply_delete_dashboard(
             status="error",
             details={"error": str(e)},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Failed to delete dashboard: {e}",
-            },
-            indent=2,
+            }
         )
 
+    _invalidate_workspace_cache(ws_id)
+
     # Log successful deletion
     _log_audit(
         customer=customer_name,
@@ -4122,7 +4739,7 @@ def apply_delete_dashboard(
         details={"title": dashboard_title, "backup_path": backup_path},
     )
 
-    return json.dumps(
+    return _dump_json(
         {
             "success": True,
             "deleted_dashboard_id": dashboard_id,
@@ -4133,8 +4750,7 @@ def apply_delete_dashboard(
                 f"To restore, call: restore_dashboard_from_backup("
                 f"backup_path='{backup_path}', customer='{customer_name}')"
             ),
-        },
-        indent=2,
+        }
     )
 
 
@@ -4155,8 +4771,6 @@ def restore_dashboard_from_backup(
     Returns:
         JSON with success status and details.
     """
-    import requests
-
     _load_env()
     host = os.getenv("GOODDATA_HOST")
     token = os.getenv("GOODDATA_TOKEN")
@@ -4164,43 +4778,38 @@ def restore_dashboard_from_backup(
     if not host or not token:
         raise ValueError("GOODDATA_HOST and GOODDATA_TOKEN must be set")
 
-    customer_name = _resolve_customer_name(customer)
-    ws_id = _resolve_workspace_id(customer)
+    customer_name, ws_id = _resolve_customer(customer)
 
     # Read the backup file
     backup_file = Path(backup_path)
     if not backup_file.exists():
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Backup file not found: {backup_path}",
-            },
-            indent=2,
+            }
         )
 
-    with open(backup_file) as f:
-        backup_data = json.load(f)
+    backup_data = _load_backup(backup_file)
 
     # Verify backup type
     if backup_data.get("object_type") != "analyticalDashboard":
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Invalid backup type: {backup_data.get('object_type')}. Expected 'analyticalDashboard'.",
-            },
-            indent=2,
+            }
         )
 
     original_data = backup_data.get("data", {})
     dashboard_id = backup_data.get("object_id")
 
     if not dashboard_id or not original_data:
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": "Invalid backup file structure.",
-            },
-            indent=2,
+            }
         )
 
     # Check if dashboard exists (PUT for update) or needs to be created (POST)
@@ -4217,10 +4826,10 @@ def restore_dashboard_from_backup(
         if existing is not None:
             # Update existing
             url = f"{url}/{dashboard_id}"
-            response = requests.put(url, headers=headers, json=original_data)
+            response = _get_http_session().put(url, headers=headers, json=original_data)
         else:
             # Create new
-            response = requests.post(url, headers=headers, json=original_data)
+            response = _get_http_session().post(url, headers=headers, json=original_data)
         response.raise_for_status()
     except Exception as e:
         _log_audit(
@@ -4230,14 +4839,15 @@ def restore_dashboard_from_backup(
             status="error",
             details={"error": str(e), "backup_path": backup_path},
         )
-        return json.dumps(
+        return _dump_json(
             {
                 "success": False,
                 "error": f"Failed to restore dashboard: {e}",
-            },
-            indent=2,
+            }
         )
 
+    _invalidate_workspace_cache(ws_id)
+
     # Log successful restore
     _log_audit(
         customer=customer_name,
@@ -4249,15 +4859,14 @@ def restore_dashboard_from_backup(
 
     dashboard_title = original_data.get("data", {}).get("attributes", {}).get("title", "")
 
-    return json.dumps(
+    return _dump_json(
         {
             "success": True,
             "dashboard_id": dashboard_id,
             "title": dashboard_title,
             "message": f"Successfully restored dashboard '{dashboard_title}' from backup.",
             "action": "updated" if existing else "created",
-        },
-        indent=2,
+        }
     )
 
 
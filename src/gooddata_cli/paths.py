@@ -0,0 +1,19 @@
+"""Filesystem locations shared by the CLI and the MCP server."""
+
+from pathlib import Path
+
+# Directories already created by this process
+_ENSURED_DIRS: set[Path] = set()
+
+
+def ensure_dir(directory: Path) -> Path:
+    """Create a directory once per process and return it."""
+    if directory not in _ENSURED_DIRS:
+        directory.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+    return directory
+
+
+def default_export_path(file_name: str) -> str:
+    """Return ./exports/<file_name>, creating the exports directory once."""
+    return str(ensure_dir(Path.cwd() / "exports") / file_name)
@@ -4,17 +4,26 @@ import os
 from functools import lru_cache
 from pathlib import Path
 
-from dotenv import load_dotenv
 from gooddata_sdk import GoodDataSdk
 
+# .env at the repository root, used when present
+_ENV_PATH = Path(__file__).parent.parent.parent / ".env"
+_ENV_LOADED = False
+
 
 def _load_env() -> None:
-    """Load environment variables from .env file."""
-    env_path = Path(__file__).parent.parent.parent / ".env"
-    if env_path.exists():
-        load_dotenv(env_path)
+    """Load environment variables from .env file, once per process."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+
+    from dotenv import load_dotenv
+
+    if _ENV_PATH.exists():
+        load_dotenv(_ENV_PATH)
     else:
         load_dotenv()
+    _ENV_LOADED = True
 
 
 @lru_cache(maxsize=1)
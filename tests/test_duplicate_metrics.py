@@ -0,0 +1,155 @@
+"""Tests for the preview/apply flow of duplicate-metric removal."""
+
+import orjson
+import pytest
+
+pytest.importorskip("mcp")
+pytest.importorskip("gooddata_sdk")
+
+from gooddata_cli import mcp_server
+
+HOST = "https://example.gooddata.com"
+
+
+def _insight(insight_id: str, metric_ids: list[str]) -> dict:
+    items = [
+        {
+            "measure": {
+                "localIdentifier": f"m{i}",
+                "title": metric_id,
+                "definition": {"measureDefinition": {"item": {"identifier": {"id": metric_id}}}},
+            }
+        }
+        for i, metric_id in enumerate(metric_ids)
+    ]
+    return {
+        "data": {
+            "id": insight_id,
+            "attributes": {
+                "title": insight_id,
+                "content": {"buckets": [{"localIdentifier": "measures", "items": items}]},
+            },
+        }
+    }
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int = 200, body: dict | None = None, etag: str | None = None):
+        self.status_code = status_code
+        self.content = orjson.dumps(body or {})
+        self.headers = {"ETag": etag} if etag else {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _FakeSession:
+    """Serves insights by ID and records every request."""
+
+    def __init__(self, insights: dict[str, dict]):
+        self.insights = insights
+        self.put_status = 200
+        self.gets: list[str] = []
+        self.puts: list[tuple[str, dict, dict]] = []
+
+    @staticmethod
+    def _insight_id(url: str) -> str:
+        return url.rsplit("/", 1)[-1]
+
+    def get(self, url, headers=None, **kwargs):
+        insight_id = self._insight_id(url)
+        self.gets.append(insight_id)
+        return _FakeResponse(body=self.insights[insight_id], etag=f'"etag-{insight_id}"')
+
+    def put(self, url, headers=None, json=None, **kwargs):
+        self.puts.append((self._insight_id(url), dict(headers), json))
+        return _FakeResponse(status_code=self.put_status)
+
+
+@pytest.fixture
+def session(monkeypatch, tmp_path):
+    fake = _FakeSession(
+        {
+            "a": _insight("a", ["revenue", "revenue", "cost"]),
+            "b": _insight("b", ["margin", "margin"]),
+        }
+    )
+    audits = []
+    monkeypatch.setenv("GOODDATA_HOST", HOST)
+    monkeypatch.setenv("GOODDATA_TOKEN", "token")
+    monkeypatch.setattr(mcp_server, "_load_env", lambda: None)
+    monkeypatch.setattr(mcp_server, "_resolve_customer", lambda customer=None: ("acme", "ws"))
+    monkeypatch.setattr(mcp_server, "_get_http_session", lambda: fake)
+    monkeypatch.setattr(mcp_server, "_save_backup", lambda *args: tmp_path / "backup.json.gz")
+    monkeypatch.setattr(mcp_server, "_log_audit", lambda **entry: audits.append(entry))
+    monkeypatch.setattr(mcp_server, "_invalidate_workspace_cache", lambda ws_id: None)
+    monkeypatch.setattr(mcp_server, "_preview_cache", {})
+    fake.audits = audits
+    return fake
+
+
+def _preview(insight_id: str) -> str:
+    result = orjson.loads(mcp_server.preview_remove_duplicate_metrics(insight_id))
+    return result["confirmation_token"]
+
+
+def _apply(insight_id: str, token: str) -> dict:
+    return orjson.loads(mcp_server.apply_remove_duplicate_metrics(insight_id, token))
+
+
+def test_apply_reuses_cached_preview(session):
+    token = _preview("a")
+    result = _apply("a", token)
+
+    assert result["success"] is True
+    assert result["removed_count"] == 1
+    # The apply was served from the preview's cached body
+    assert session.gets == ["a"]
+    insight_id, headers, body = session.puts[0]
+    assert insight_id == "a"
+    assert headers["If-Match"] == '"etag-a"'
+    items = body["data"]["attributes"]["content"]["buckets"][0]["items"]
+    assert [i["measure"]["localIdentifier"] for i in items] == ["m0", "m2"]
+
+
+def test_apply_without_preview_sends_fetched_etag(session):
+    token = _preview("a")
+    mcp_server._preview_cache.clear()
+
+    result = _apply("a", token)
+
+    assert result["success"] is True
+    assert session.gets == ["a", "a"]
+    assert session.puts[0][1]["If-Match"] == '"etag-a"'
+
+
+def test_expired_preview_is_refetched(session, monkeypatch):
+    token = _preview("a")
+    monkeypatch.setattr(mcp_server, "_PREVIEW_TTL", 0.0)
+
+    assert _apply("a", token)["success"] is True
+    assert session.gets == ["a", "a"]
+
+
+def test_precondition_failed_maps_to_token_mismatch(session):
+    token = _preview("a")
+    session.put_status = 412
+
+    result = _apply("a", token)
+
+    assert result["success"] is False
+    assert "Invalid confirmation token" in result["error"]
+    assert session.audits[-1]["details"] == {"reason": "token_mismatch"}
+
+
+def test_preview_token_not_reused_for_another_insight(session):
+    token = _preview("a")
+
+    result = _apply("b", token)
+
+    assert result["success"] is False
+    assert "Invalid confirmation token" in result["error"]
+    # b was fetched and checked on its own; nothing was written
+    assert session.gets == ["a", "b"]
+    assert session.puts == []
@@ -0,0 +1,64 @@
+"""Tests for export_visualization_csv output paths and compression."""
+
+import gzip
+from pathlib import Path
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+pytest.importorskip("mcp")
+pytest.importorskip("gooddata_sdk")
+
+from gooddata_cli import mcp_server
+
+
+class _FakeExport:
+    """Mimics gooddata_sdk's export service, which appends the format extension."""
+
+    def export_tabular_by_visualization_id(
+        self, workspace_id, visualization_id, file_format, file_name, store_path=None
+    ):
+        path = Path(store_path or Path.cwd()) / f"{file_name}.{file_format.lower()}"
+        path.write_text("a,b\n1,2\n")
+
+
+@pytest.fixture
+def fake_sdk(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(mcp_server, "_get_sdk", lambda: SimpleNamespace(export=_FakeExport()))
+    monkeypatch.setattr(mcp_server, "_resolve_workspace_id", lambda customer=None: "ws")
+    return tmp_path
+
+
+def _export(**kwargs) -> Path:
+    result = orjson.loads(mcp_server.export_visualization_csv("viz", **kwargs))
+    assert result["success"] is True
+    return Path(result["path"])
+
+
+def test_plain_csv_reports_written_path(fake_sdk):
+    path = _export(output_path=str(fake_sdk / "out.csv"))
+
+    assert path == fake_sdk / "out.csv"
+    assert path.read_text() == "a,b\n1,2\n"
+
+
+def test_gzip_compression(fake_sdk):
+    path = _export(output_path=str(fake_sdk / "out.csv"), compression="gzip")
+
+    assert path == fake_sdk / "out.csv.gz"
+    assert gzip.decompress(path.read_bytes()) == b"a,b\n1,2\n"
+    assert not (fake_sdk / "out.csv").exists()
+
+
+def test_compression_inferred_from_suffix(fake_sdk):
+    path = _export(output_path=str(fake_sdk / "out.csv.gz"))
+
+    assert path == fake_sdk / "out.csv.gz"
+    assert gzip.decompress(path.read_bytes()) == b"a,b\n1,2\n"
+
+
+def test_unknown_compression_rejected(fake_sdk):
+    with pytest.raises(ValueError):
+        mcp_server.export_visualization_csv("viz", compression="bz2")